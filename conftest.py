@@ -0,0 +1 @@
+# Lets pytest import pflib/malib from the repository root without installing them
@@ -4,11 +4,32 @@ MenuAccess Library Package
 This package contains modules for the Accessible Menu Navigation application.
 """
 
+import importlib
+
 # Version information
 __version__ = "1.0"
 
-# Import key components to simplify importing from the package
-from malib.utils import setup_logging
-from malib.screen_capture import ScreenCapture
-from malib.condition_checker import MenuConditionChecker
-from malib.navigator import AccessibleMenuNavigator
+# Key components re-exported to simplify importing from the package. They are loaded on first
+# access: the profile editor imports malib.screen_capture, which runs this file first, and eager
+# imports here would load OpenCV and pyautogui through the condition checker and navigator.
+_EXPORTS = {
+    "setup_logging": "malib.utils",
+    "ScreenCapture": "malib.screen_capture",
+    "MenuConditionChecker": "malib.condition_checker",
+    "AccessibleMenuNavigator": "malib.navigator",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value # Later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -3,14 +3,22 @@ Screen capture functionality for the MenuAccess application
 """
 
 import logging
+import sys
 import threading
 import time
-import numpy as np
-import pyautogui
 from PIL import Image
 
 logger = logging.getLogger("AccessibleMenuNav")
 
+# Importing pyautogui used to do this as a side effect. Without it, Windows scales coordinates
+# for high-DPI screens and capture regions stop lining up with cursor positions.
+if sys.platform == "win32":
+    import ctypes
+    try:
+        ctypes.windll.user32.SetProcessDPIAware()
+    except (AttributeError, OSError):
+        pass
+
 # Try to import dxcam-cpp if available
 try:
     import dxcam
@@ -193,6 +201,7 @@ class ScreenCapture:
     def _capture_pyautogui(self, region=None):
         """Capture using pyautogui as last resort"""
         try:
+            import pyautogui # Deferred: only needed when neither dxcam nor MSS is usable
             if region:
                 screenshot = pyautogui.screenshot(region=(region[0], region[1], region[2], region[3]))
             else:
@@ -4,12 +4,34 @@ Profile Creator Library Package
 This package contains modules for the Enhanced UI Profile Creator application.
 """
 
+import importlib
+
 # Version information
 __version__ = "1"
 
-# Import key components to simplify importing from the package
-from pflib.utils import APP_TITLE, APP_VERSION
-from pflib.ui_components import ColorDisplay, CursorTracker
-from pflib.profile_editor import ProfileEditorFrame
-from pflib.menu_condition import MenuCondition
-from pflib.menu_panel import MenuPanel
\ No newline at end of file
+# Key components re-exported to simplify importing from the package. They are loaded on first
+# access, so importing one pflib module doesn't pull in OpenCV through MenuCondition.
+_EXPORTS = {
+    "APP_TITLE": "pflib.utils",
+    "APP_VERSION": "pflib.utils",
+    "ColorDisplay": "pflib.ui_components",
+    "CursorTracker": "pflib.ui_components",
+    "ProfileEditorFrame": "pflib.profile_editor",
+    "MenuCondition": "pflib.menu_condition",
+    "MenuPanel": "pflib.menu_panel",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value # Later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
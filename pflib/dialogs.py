@@ -11,7 +11,7 @@ import base64
 import io
 
 from pflib.ui_components import ColorDisplay
-from pflib.utils import get_cursor_tracker
+from pflib.utils import get_cursor_tracker, normalize_element
 from malib.screen_capture import ScreenCapture
 
 # --- Condition Dialogs ---
@@ -1528,19 +1528,7 @@ class UIElementDialog(wx.Dialog):
             [], None, 0, [], 0
         ]
         
-        while len(self.element) < 11:
-            if len(self.element) == 6: 
-                self.element.append([])
-            elif len(self.element) == 7: 
-                self.element.append(None)
-            elif len(self.element) == 8: 
-                self.element.append(0)
-            elif len(self.element) == 9: 
-                self.element.append([])
-            elif len(self.element) == 10: 
-                self.element.append(0)
-            else: 
-                self.element.append(None)
+        normalize_element(self.element)
         
         self.screenshot = None
         self.cursor_tracker = get_cursor_tracker()
@@ -19,8 +19,8 @@ from malib.screen_capture import ScreenCapture
 class MenuCondition:
     """Class for defining and checking menu detection conditions"""
     
-    def __init__(self, ocr_handler=None): # Added ocr_handler
-        """Initialize the condition checker"""
+    def __init__(self, ocr_handler=None, screen_capture=None): # Added ocr_handler
+        """Initialize the condition checker, reusing screen_capture if one is given"""
         self.verbose = False
         self._sample_positions = {}  # Cache for sampling positions
         
@@ -29,8 +29,9 @@ class MenuCondition:
         self.matcher = cv2.BFMatcher(cv2.NORM_HAMMING, crossCheck=True)
         self.ocr_handler = ocr_handler
         
-        # Use unified screen capture
-        self.screen_capture = ScreenCapture()
+        # Use unified screen capture, only closing it in close() if it was created here
+        self._owns_screen_capture = screen_capture is None
+        self.screen_capture = ScreenCapture() if screen_capture is None else screen_capture
     
     def set_verbose(self, verbose):
         """Enable or disable verbose logging mode"""
@@ -274,9 +275,6 @@ class MenuCondition:
                     print(f"Region ({x1},{y1}) to ({x2},{y2}) invalid for image of size {width}x{height}")
                 return False
 
-            region_pil = screenshot_pil.crop((x1, y1, x2, y2))
-            region_array = np.array(region_pil)
-
             # Calculate region dimensions
             region_width = x2 - x1
             region_height = y2 - y1
@@ -306,37 +304,30 @@ class MenuCondition:
                     ]
                 self._sample_positions[cache_key] = sample_points_relative
             
-            # Calculate similarity for each sample point
-            matches = 0
+            # Calculate similarity for all sample points at once
             if not sample_points_relative: return False # Avoid division by zero if no sample points
 
+            # The expected color is the same for every sample point, so convert it to HSV once
+            expected_rgb_cv = np.array([[expected_color]], dtype=np.uint8)
+            h2, s2, v2 = cv2.cvtColor(expected_rgb_cv, cv2.COLOR_RGB2HSV)[0][0].astype(float)
+
+            # Read the sampled pixels straight from the screenshot instead of copying the whole region out
+            sampled_colors = []
             for rel_px, rel_py in sample_points_relative:
-                try:
-                    # Ensure relative coordinates are within the cropped region_array bounds
-                    if rel_px >= region_array.shape[1] or rel_py >= region_array.shape[0]:
-                        if self.verbose: print(f"Sample point ({rel_px},{rel_py}) out of bounds for cropped region.")
-                        continue
+                # Ensure relative coordinates are within the region bounds
+                if rel_px >= region_width or rel_py >= region_height:
+                    if self.verbose: print(f"Sample point ({rel_px},{rel_py}) out of bounds for region.")
+                    continue
+                sampled_colors.append(screenshot_pil.getpixel((x1 + rel_px, y1 + rel_py))[:3]) # Drop alpha if RGBA
 
-                    pixel_color = region_array[rel_py, rel_px]
-                    if len(pixel_color) > 3: pixel_color = pixel_color[:3] # Handle RGBA
-                    
-                    pixel_rgb_cv = np.array([[pixel_color]], dtype=np.uint8)
-                    expected_rgb_cv = np.array([[expected_color]], dtype=np.uint8)
-                    
-                    pixel_hsv = cv2.cvtColor(pixel_rgb_cv, cv2.COLOR_RGB2HSV)[0][0]
-                    expected_hsv = cv2.cvtColor(expected_rgb_cv, cv2.COLOR_RGB2HSV)[0][0]
-                    
-                    h1, s1, v1 = pixel_hsv.astype(float)
-                    h2, s2, v2 = expected_hsv.astype(float)
-                    
-                    h_diff = min(abs(h1 - h2), 180 - abs(h1 - h2))
-                    weighted_diff = (h_diff * 2.0) + (abs(s1 - s2) / 2.0) + (abs(v1 - v2) / 4.0)
-                    
-                    if weighted_diff <= tolerance:
-                        matches += 1
-                except Exception as e:
-                    if self.verbose:
-                        print(f"Error checking pixel at relative ({rel_px},{rel_py}): {str(e)}")
+            matches = 0
+            if sampled_colors:
+                # One HSV conversion and one weighted difference for every sample, same formula as the pixel check
+                sampled_hsv = cv2.cvtColor(np.array([sampled_colors], dtype=np.uint8), cv2.COLOR_RGB2HSV)[0].astype(float)
+                h_diff = np.abs(sampled_hsv[:, 0] - h2)
+                h_diff = np.minimum(h_diff, 180.0 - h_diff)
+                weighted_diff = (h_diff * 2.0) + (np.abs(sampled_hsv[:, 1] - s2) / 2.0) + (np.abs(sampled_hsv[:, 2] - v2) / 4.0)
+                matches = int(np.count_nonzero(weighted_diff <= tolerance))
                 
             # Calculate match percentage
             match_percentage = matches / len(sample_points_relative)
@@ -468,5 +459,5 @@ class MenuCondition:
     
     def close(self):
         """Clean up resources"""
-        if hasattr(self, 'screen_capture'):
+        if hasattr(self, 'screen_capture') and self._owns_screen_capture:
             self.screen_capture.close()
\ No newline at end of file
@@ -4,15 +4,70 @@ Menu panel for editing menu data with improved drag and drop
 
 import wx
 import wx.lib.scrolledpanel as scrolled
-import copy
+from collections import defaultdict
+from operator import itemgetter
 
-from pflib.dialogs import (
-    PixelColorConditionDialog, RegionColorConditionDialog, 
-    RegionImageConditionDialog, UIElementDialog,
-    OCRTextMatchConditionDialog, ORConditionDialog # New condition dialogs
-)
-from pflib.bulk_edit_dialog import BulkEditElementsDialog
-from pflib.condition_bulk_edit import BulkEditConditionsDialog
+from pflib.utils import clone_condition, clone_element, normalize_element
+
+# The editing dialogs are imported inside the handlers that open them: pflib.dialogs
+# pulls in pynput, PIL and screen capture, which the panel itself does not need
+
+# Element field index for each value key a BulkEditElementsDialog can return
+_BULK_ELEMENT_FIELDS = ((2, 'type'), (3, 'speaks_on_select'), (4, 'submenu_id'), (5, 'group'))
+
+def _iter_selected(list_ctrl):
+    """Yield the row index of every selected item in a wx.ListCtrl"""
+    row = list_ctrl.GetFirstSelected()
+    while row != -1:
+        yield row
+        row = list_ctrl.GetNextSelected(row)
+
+def _format_condition_details(condition):
+    """Build the details column text shown for a condition in the conditions list"""
+    condition_type = condition.get("type", "unknown")
+    if condition_type == "pixel_color": details = f"({condition['x']},{condition['y']}) RGB{condition['color']} Tol:{condition['tolerance']}"
+    elif condition_type == "pixel_region_color": details = f"Region({condition['x1']},{condition['y1']}-{condition['x2']},{condition['y2']}) RGB{condition['color']} Tol:{condition['tolerance']} Thresh:{condition['threshold']}"
+    elif condition_type == "pixel_region_image": details = f"Region({condition['x1']},{condition['y1']}-{condition['x2']},{condition['y2']}) Conf:{condition['confidence']:.2f} Img:{'Yes' if condition.get('image_data') else 'No'}"
+    elif condition_type == "ocr_text_match": details = f"Region({condition['x1']},{condition['y1']}-{condition['x2']},{condition['y2']}) Text: '{condition.get('expected_text','')[:20]}...'"
+    elif condition_type == "or": details = f"OR (Sub1: {condition['conditions'][0].get('type', 'N/A')}, Sub2: {condition['conditions'][1].get('type', 'N/A')})"
+    else: details = str(condition)[:50]
+    if condition.get("negate"): details = "NOT " + details
+    return details
+
+def _element_row_text(element, group_name):
+    """Build the column strings shown for an element in the elements list"""
+    ocr_count = len(element[6]) if element[6] else 0
+    cond_count = len(element[9]) if element[9] else 0
+    return (
+        element[1], element[2], f"({element[0][0]},{element[0][1]})", group_name,
+        str(element[4] or ""), str(ocr_count) if ocr_count else "",
+        "Yes" if element[7] else "", str(element[8]),
+        str(cond_count) if cond_count else ""
+    )
+
+class ElementsListCtrl(wx.ListCtrl):
+    """Virtual report list that pulls its element and group header rows from the owning MenuPanel"""
+    
+    def __init__(self, parent, menu_panel, size=wx.DefaultSize):
+        super().__init__(parent, style=wx.LC_REPORT | wx.LC_VIRTUAL | wx.LC_EDIT_LABELS, size=size)
+        self.menu_panel = menu_panel
+        self.header_attr = wx.ItemAttr(wx.Colour(0, 0, 128), wx.Colour(200, 220, 255), menu_panel._header_font)
+    
+    def OnGetItemText(self, item, column):
+        return self.menu_panel._row_text[item][column]
+    
+    def OnGetItemAttr(self, item):
+        return self.header_attr if self.menu_panel._row_item_data[item] == -1 else None
+
+class ConditionsListCtrl(wx.ListCtrl):
+    """Virtual report list that pulls its menu condition rows from the owning MenuPanel"""
+    
+    def __init__(self, parent, menu_panel, size=wx.DefaultSize):
+        super().__init__(parent, style=wx.LC_REPORT | wx.LC_VIRTUAL, size=size)
+        self.menu_panel = menu_panel
+    
+    def OnGetItemText(self, item, column):
+        return self.menu_panel._condition_rows[item][column]
 
 class GroupManagerDialog(wx.Dialog):
     """Dialog for managing element groups in a menu, with ordering support"""
@@ -31,17 +86,19 @@ class GroupManagerDialog(wx.Dialog):
         # Collect all existing groups from items and ensure they are in group_order_indices
         # Assign a high index to new groups found in items but not in order_indices
         # to place them at the end initially.
-        max_existing_order_index = 0
-        if self.menu_data["group_order_indices"]:
-             max_existing_order_index = max(self.menu_data["group_order_indices"].values() or [0])
+        max_existing_order_index = max(self.menu_data["group_order_indices"].values(), default=0)
 
+        # Index the elements by group once; rename/delete then only touch the affected group
+        self._items_by_group = defaultdict(list)
         if "items" in self.menu_data:
             for item in self.menu_data["items"]:
-                group_name = item[5] if len(item) > 5 and item[5] else "default"
+                group_name = item[5] or "default"
+                self._items_by_group[group_name].append(item)
                 if group_name not in self.menu_data["group_order_indices"]:
                     max_existing_order_index += 10 # Increment for new group
                     self.menu_data["group_order_indices"][group_name] = max_existing_order_index
         
+        self._displayed_rows = None # (name, order index, element count) per group_list row
         self.init_ui()
         self.Center()
         
@@ -112,7 +169,10 @@ class GroupManagerDialog(wx.Dialog):
         self.group_list.Bind(wx.EVT_LEAVE_WINDOW, self.on_leave_window)
         
         self.drag_item_idx = None # Store list index of dragged item
-        self.drag_image = None
+        self._default_row_bg = self.group_list.GetBackgroundColour() # Restores rows after drop highlighting
+        self._highlight_row_bg = wx.Colour(200, 220, 255) # Drop target highlight
+        self._motion_pos = None # Latest drag position, handled by _process_motion
+        self._motion_pending = False
         self.drop_target_idx = None # Store list index of drop target
         
         self.update_ui_buttons()
@@ -122,11 +182,7 @@ class GroupManagerDialog(wx.Dialog):
         self.update_ui_buttons()
         item_idx = self.group_list.GetFirstSelected()
         if item_idx != -1:
-            order_index_str = self.group_list.GetItemText(item_idx, 1)
-            try:
-                self.index_spinner.SetValue(int(order_index_str))
-            except ValueError:
-                self.index_spinner.SetValue(0) # Fallback
+            self.index_spinner.SetValue(int(self._displayed_rows[item_idx][1]))
     
     def update_ui_buttons(self):
         selection_idx = self.group_list.GetFirstSelected()
@@ -135,7 +191,7 @@ class GroupManagerDialog(wx.Dialog):
         self.rename_btn.Enable(has_selection)
         can_delete = False
         if has_selection:
-            group_name = self.group_list.GetItemText(selection_idx, 0)
+            group_name = self._displayed_rows[selection_idx][0]
             can_delete = group_name != "default"
         self.delete_btn.Enable(can_delete)
         
@@ -143,17 +199,11 @@ class GroupManagerDialog(wx.Dialog):
         self.move_down_btn.Enable(has_selection and selection_idx < self.group_list.GetItemCount() - 1)
         
     def count_elements_in_group(self, group_name_to_count):
-        count = 0
-        if "items" in self.menu_data:
-            for item in self.menu_data["items"]:
-                item_group = item[5] if len(item) > 5 and item[5] else "default"
-                if item_group == group_name_to_count:
-                    count += 1
-        return count
+        return len(self._items_by_group.get(group_name_to_count, ()))
     
     def on_begin_drag(self, event):
         item_idx = event.GetIndex()
-        group_name = self.group_list.GetItemText(item_idx, 0)
+        group_name = self._displayed_rows[item_idx][0]
         if group_name == "default": return # Cannot drag default
             
         self.drag_item_idx = item_idx
@@ -164,21 +214,32 @@ class GroupManagerDialog(wx.Dialog):
 
     def on_motion(self, event):
         if self.drag_item_idx is not None and event.Dragging():
-            pos = event.GetPosition()
-            item_idx_over, flags = self.group_list.HitTest(pos)
+            # Coalesce motion events so the hit-test/highlight runs at most every 16 ms
+            self._motion_pos = event.GetPosition()
+            if not self._motion_pending:
+                self._motion_pending = True
+                wx.CallLater(16, self._process_motion)
+        event.Skip()
+    
+    def _process_motion(self):
+        if not self or not self._motion_pending: return
+        self._motion_pending = False
+        if self.drag_item_idx is not None:
+            item_idx_over, flags = self.group_list.HitTest(self._motion_pos)
+            new_target_idx = item_idx_over if item_idx_over != -1 and item_idx_over != self.drag_item_idx else None
 
-            # Clear previous drop indicator
-            if self.drop_target_idx is not None and self.drop_target_idx < self.group_list.GetItemCount():
-                 self.group_list.SetItemBackgroundColour(self.drop_target_idx, self.group_list.GetBackgroundColour())
+            # Only repaint when the drop target row actually changes
+            if new_target_idx != self.drop_target_idx:
+                # Clear previous drop indicator
+                if self.drop_target_idx is not None and self.drop_target_idx < self.group_list.GetItemCount():
+                     self.group_list.SetItemBackgroundColour(self.drop_target_idx, self._default_row_bg)
 
-            if item_idx_over != -1 and item_idx_over != self.drag_item_idx:
-                self.drop_target_idx = item_idx_over
-                self.group_list.SetItemBackgroundColour(self.drop_target_idx, wx.Colour(200, 220, 255)) # Highlight
-            else:
-                self.drop_target_idx = None
-        event.Skip()
+                self.drop_target_idx = new_target_idx
+                if new_target_idx is not None:
+                    self.group_list.SetItemBackgroundColour(new_target_idx, self._highlight_row_bg)
     
     def on_left_up(self, event):
+        if self._motion_pending: self._process_motion() # Drop on the latest hovered row
         if self.drag_item_idx is not None:
             self.group_list.SetCursor(wx.Cursor(wx.CURSOR_DEFAULT))
             if self.drop_target_idx is not None and self.drop_target_idx != self.drag_item_idx:
@@ -186,7 +247,7 @@ class GroupManagerDialog(wx.Dialog):
             
             # Clear highlighting
             if self.drop_target_idx is not None and self.drop_target_idx < self.group_list.GetItemCount():
-                self.group_list.SetItemBackgroundColour(self.drop_target_idx, self.group_list.GetBackgroundColour())
+                self.group_list.SetItemBackgroundColour(self.drop_target_idx, self._default_row_bg)
 
             self.drag_item_idx = None
             self.drop_target_idx = None
@@ -197,35 +258,24 @@ class GroupManagerDialog(wx.Dialog):
         if self.drag_item_idx is not None:
             self.group_list.SetCursor(wx.Cursor(wx.CURSOR_DEFAULT))
             if self.drop_target_idx is not None and self.drop_target_idx < self.group_list.GetItemCount():
-                 self.group_list.SetItemBackgroundColour(self.drop_target_idx, self.group_list.GetBackgroundColour())
+                 self.group_list.SetItemBackgroundColour(self.drop_target_idx, self._default_row_bg)
             self.drag_item_idx = None
             self.drop_target_idx = None
             self.update_ui_buttons()
         event.Skip()
             
     def reorder_group(self, src_list_idx, dst_list_idx):
-        src_group_name = self.group_list.GetItemText(src_list_idx, 0)
-        dst_group_name = self.group_list.GetItemText(dst_list_idx, 0)
-
-        src_order_index = self.menu_data["group_order_indices"][src_group_name]
-        dst_order_index = self.menu_data["group_order_indices"][dst_group_name]
-
-        if src_list_idx < dst_list_idx: # Moving down
-            # Shift items between src and dst up
-            for name, order_idx in self.menu_data["group_order_indices"].items():
-                if src_order_index < order_idx <= dst_order_index:
-                    self.menu_data["group_order_indices"][name] = order_idx - 1 # Or some other step
-            self.menu_data["group_order_indices"][src_group_name] = dst_order_index
-        else: # Moving up
-            # Shift items between dst and src down
-            for name, order_idx in self.menu_data["group_order_indices"].items():
-                if dst_order_index <= order_idx < src_order_index:
-                    self.menu_data["group_order_indices"][name] = order_idx + 1 # Or some other step
-            self.menu_data["group_order_indices"][src_group_name] = dst_order_index
-        
-        # Normalize indices to be somewhat sequential if gaps are too large or collisions happened
-        self.normalize_group_order_indices()
-        self.update_group_list_display()
+        order_indices = self.menu_data["group_order_indices"]
+        # The group list shows groups sorted by order index, so list positions map onto this order
+        ordered_names = sorted(order_indices, key=order_indices.get)
+        moved_name = ordered_names.pop(src_list_idx)
+        ordered_names.insert(dst_list_idx, moved_name)
+        
+        # Renumber in one pass, using the same steps of 10 as normalize_group_order_indices
+        for position, name in enumerate(ordered_names):
+            order_indices[name] = position * 10
+        
+        self.group_list.Select(self.update_group_list_display()[moved_name])
         self.menu_panel.profile_editor.mark_profile_changed()
         self.SetReturnCode(wx.ID_OK) # Indicate changes made
             
@@ -237,12 +287,10 @@ class GroupManagerDialog(wx.Dialog):
                 if group_name in self.menu_data["group_order_indices"]:
                     wx.MessageBox(f"Group '{group_name}' already exists", "Duplicate Group", wx.ICON_ERROR)
                 else:
-                    max_order_idx = 0
-                    if self.menu_data["group_order_indices"]:
-                        max_order_idx = max(self.menu_data["group_order_indices"].values() or [0])
+                    max_order_idx = max(self.menu_data["group_order_indices"].values(), default=0)
                     self.menu_data["group_order_indices"][group_name] = max_order_idx + 10
                     
-                    self.update_group_list_display()
+                    self.group_list.Select(self.update_group_list_display()[group_name])
                     self.menu_panel.profile_editor.mark_profile_changed()
                     self.SetReturnCode(wx.ID_OK)
         dialog.Destroy()
@@ -250,7 +298,7 @@ class GroupManagerDialog(wx.Dialog):
     def on_rename_group(self, event):
         selection_idx = self.group_list.GetFirstSelected()
         if selection_idx == -1: return
-        old_name = self.group_list.GetItemText(selection_idx, 0)
+        old_name = self._displayed_rows[selection_idx][0]
         if old_name == "default":
             wx.MessageBox("Cannot rename the 'default' group", "Error", wx.ICON_ERROR); return
             
@@ -266,10 +314,11 @@ class GroupManagerDialog(wx.Dialog):
                 self.menu_data["group_order_indices"][new_name] = order_idx
                 
                 # Update elements
-                for item in self.menu_data.get("items", []):
-                    if len(item) > 5 and item[5] == old_name: item[5] = new_name
+                moved_items = self._items_by_group.pop(old_name, [])
+                for item in moved_items: item[5] = new_name
+                self._items_by_group[new_name].extend(moved_items)
                 
-                self.update_group_list_display()
+                self.group_list.Select(self.update_group_list_display()[new_name])
                 self.menu_panel.profile_editor.mark_profile_changed()
                 self.SetReturnCode(wx.ID_OK)
         dialog.Destroy()
@@ -277,7 +326,7 @@ class GroupManagerDialog(wx.Dialog):
     def on_delete_group(self, event):
         selection_idx = self.group_list.GetFirstSelected()
         if selection_idx == -1: return
-        group_name_to_delete = self.group_list.GetItemText(selection_idx, 0)
+        group_name_to_delete = self._displayed_rows[selection_idx][0]
         if group_name_to_delete == "default":
             wx.MessageBox("Cannot delete the 'default' group", "Error", wx.ICON_ERROR); return
             
@@ -286,8 +335,9 @@ class GroupManagerDialog(wx.Dialog):
         if wx.MessageBox(msg, "Confirm Delete", wx.YES_NO | wx.ICON_QUESTION) != wx.YES: return
             
         # Move elements to default group
-        for item in self.menu_data.get("items", []):
-            if len(item) > 5 and item[5] == group_name_to_delete: item[5] = "default"
+        moved_items = self._items_by_group.pop(group_name_to_delete, [])
+        for item in moved_items: item[5] = "default"
+        self._items_by_group["default"].extend(moved_items)
         
         del self.menu_data["group_order_indices"][group_name_to_delete]
         self.update_group_list_display()
@@ -307,7 +357,7 @@ class GroupManagerDialog(wx.Dialog):
     def on_set_index(self, event):
         selection_idx = self.group_list.GetFirstSelected()
         if selection_idx == -1: return
-        group_name = self.group_list.GetItemText(selection_idx, 0)
+        group_name = self._displayed_rows[selection_idx][0]
         new_order_index = self.index_spinner.GetValue()
         
         # Check for conflicts and adjust if necessary
@@ -318,31 +368,42 @@ class GroupManagerDialog(wx.Dialog):
         
         self.menu_data["group_order_indices"][group_name] = new_order_index
         self.normalize_group_order_indices()
-        self.update_group_list_display()
+        self.group_list.Select(self.update_group_list_display()[group_name])
         self.menu_panel.profile_editor.mark_profile_changed()
         self.SetReturnCode(wx.ID_OK)
 
     def normalize_group_order_indices(self):
         """Ensures group order indices are somewhat sequential without gaps/major collisions."""
-        sorted_groups = sorted(self.menu_data["group_order_indices"].items(), key=lambda item: item[1])
+        sorted_groups = sorted(self.menu_data["group_order_indices"].items(), key=itemgetter(1))
         current_idx = 0
         for name, _ in sorted_groups:
             self.menu_data["group_order_indices"][name] = current_idx
             current_idx += 10 # Use steps of 10
     
     def update_group_list_display(self):
-        self.group_list.DeleteAllItems()
+        """Refresh the group list and return a mapping of group name to its row"""
         # Sort groups by their order index for display
         sorted_groups_for_display = sorted(
             self.menu_data["group_order_indices"].items(), 
-            key=lambda item: item[1]
+            key=itemgetter(1)
         )
-        for i, (group_name, order_index) in enumerate(sorted_groups_for_display):
-            idx = self.group_list.InsertItem(i, group_name)
-            self.group_list.SetItem(idx, 1, str(order_index))
-            element_count = self.count_elements_in_group(group_name)
-            self.group_list.SetItem(idx, 2, str(element_count))
+        rows = [
+            (group_name, order_index, self.count_elements_in_group(group_name))
+            for group_name, order_index in sorted_groups_for_display
+        ]
+        if rows != self._displayed_rows: # Leave the list (and its selection) alone if nothing changed
+            self.group_list.Freeze()
+            try:
+                self.group_list.DeleteAllItems()
+                for i, (group_name, order_index, element_count) in enumerate(rows):
+                    idx = self.group_list.InsertItem(i, group_name)
+                    self.group_list.SetItem(idx, 1, str(order_index))
+                    self.group_list.SetItem(idx, 2, str(element_count))
+            finally:
+                self.group_list.Thaw()
+            self._displayed_rows = rows
         self.update_ui_buttons()
+        return {row[0]: i for i, row in enumerate(rows)}
 
 
 class MenuPanel(scrolled.ScrolledPanel):
@@ -359,6 +420,21 @@ class MenuPanel(scrolled.ScrolledPanel):
         self.drag_element_start_pos = None
         self.drag_element_list_idx = None 
         self.drop_element_indicator_line = None
+        self._element_motion_pos = None # Latest drag position, handled by _process_element_motion
+        self._element_motion_pending = False
+        self._drop_indicator_pen = wx.Pen(wx.BLUE, 2)
+        self._drop_overlay = wx.Overlay() # Holds the drop indicator line while dragging elements
+        self._drawn_drop_indicator = (None, None) # (row, y) of the indicator currently on the overlay
+        self._row_item_data = [] # Data index per elements_list row (-1 for group headers)
+        self._row_text = [] # Column strings per elements_list row
+        self._row_group = [] # Group name per elements_list row, headers included
+        self._refresh_pending = False
+        self._groups_cache = None # Result of get_all_groups, see invalidate_groups
+        self._filter_timer = None
+        self._rendered_filter_idx = None # group_filter selection the elements list was last built for
+        self._condition_rows = [] # (type, details) per conditions_list row
+        self._condition_details = {} # id(condition) -> (condition, details text) from the last list build
+        self._header_font = wx.Font(wx.NORMAL_FONT.GetPointSize(), wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_BOLD)
         
         self.SetMinSize((750, 600))
         self.Bind(wx.EVT_KEY_DOWN, self.on_key_down)
@@ -371,9 +447,9 @@ class MenuPanel(scrolled.ScrolledPanel):
         self.main_sizer = wx.BoxSizer(wx.VERTICAL)
 
         header_sizer = wx.BoxSizer(wx.HORIZONTAL)
-        title = wx.StaticText(self, label=f"Menu: {self.menu_id}")
-        title.SetFont(wx.Font(12, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_BOLD))
-        header_sizer.Add(title, 0, wx.ALL | wx.ALIGN_CENTER_VERTICAL, 5)
+        self.title_label = wx.StaticText(self, label=f"Menu: {self.menu_id}")
+        self.title_label.SetFont(wx.Font(12, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_BOLD))
+        header_sizer.Add(self.title_label, 0, wx.ALL | wx.ALIGN_CENTER_VERTICAL, 5)
         
         option_sizer = wx.BoxSizer(wx.HORIZONTAL)
         self.is_manual_cb = wx.CheckBox(self, label="Manual Menu (ignores conditions)")
@@ -417,7 +493,7 @@ class MenuPanel(scrolled.ScrolledPanel):
         btn_sizer_cond.Add(add_ocr_match_btn,0,wx.RIGHT,5); btn_sizer_cond.Add(paste_condition_btn, 1, wx.EXPAND)
         self.conditions_sizer.Add(btn_sizer_cond, 0, wx.EXPAND | wx.ALL, 5)
         
-        self.conditions_list = wx.ListCtrl(self, style=wx.LC_REPORT, size=(-1, 150)) 
+        self.conditions_list = ConditionsListCtrl(self, self, size=(-1, 150)) 
         self.conditions_list.InsertColumn(0, "Type", width=120); self.conditions_list.InsertColumn(1, "Details", width=400)
         self.update_conditions_list()
         self.conditions_list.Bind(wx.EVT_CONTEXT_MENU, self.on_condition_context_menu)
@@ -446,7 +522,7 @@ class MenuPanel(scrolled.ScrolledPanel):
         element_btn_sizer.Add(paste_element_btn, 1, wx.EXPAND)
         elements_sizer.Add(element_btn_sizer, 0, wx.EXPAND | wx.ALL, 5)
         
-        self.elements_list = wx.ListCtrl(self, style=wx.LC_REPORT | wx.LC_EDIT_LABELS, size=(-1, 250)) 
+        self.elements_list = ElementsListCtrl(self, self, size=(-1, 250)) 
         self.elements_list.InsertColumn(0, "Name", width=150); self.elements_list.InsertColumn(1, "Type", width=80)
         self.elements_list.InsertColumn(2, "Pos", width=70); self.elements_list.InsertColumn(3, "Group", width=100)
         self.elements_list.InsertColumn(4, "Submenu", width=100); self.elements_list.InsertColumn(5, "OCR", width=40)
@@ -472,9 +548,27 @@ class MenuPanel(scrolled.ScrolledPanel):
         self.SetSizer(self.main_sizer)
         self.main_sizer.Fit(self)
         self.Layout()
-        self.on_is_manual_changed(None) 
+        self.apply_is_manual_state() # Not on_is_manual_changed: building a panel is not an edit
 
+    def set_menu_id(self, menu_id):
+        """Re-key the panel after its menu was renamed"""
+        self.menu_id = menu_id
+        self.title_label.SetLabel(f"Menu: {menu_id}")
+        self.Layout()
+    
+    def set_status(self, text):
+        """Show text in the profile editor's status bar, if it has one"""
+        statusbar = self.profile_editor.statusbar if self.profile_editor else None
+        if statusbar: statusbar.SetStatusText(text)
+    
     def on_is_manual_changed(self, event):
+        is_manual = self.apply_is_manual_state()
+        self.profile_editor.mark_profile_changed()
+        status = "manual (ignores conditions)" if is_manual else "conditional"
+        self.set_status(f"Menu '{self.menu_id}' set to {status}")
+    
+    def apply_is_manual_state(self):
+        """Store the is_manual checkbox in menu_data and enable the condition controls to match"""
         is_manual = self.is_manual_cb.GetValue()
         self.menu_data["is_manual"] = is_manual
         
@@ -488,15 +582,7 @@ class MenuPanel(scrolled.ScrolledPanel):
                     # Don't disable the StaticBox itself again, only its contents
                     if child_item.GetWindow() != self.conditions_box_static:
                         child_item.GetWindow().Enable(not is_manual)
-        
-        self.profile_editor.mark_profile_changed()
-        status = "manual (ignores conditions)" if is_manual else "conditional"
-        try:
-            # Use the stored profile_editor reference
-            if self.profile_editor and self.profile_editor.statusbar:
-                 self.profile_editor.statusbar.SetStatusText(f"Menu '{self.menu_id}' set to {status}")
-        except Exception as e:
-            print(f"Error setting status text from MenuPanel: {e}")
+        return is_manual
 
 
     def on_reset_group_changed(self, event):
@@ -504,6 +590,10 @@ class MenuPanel(scrolled.ScrolledPanel):
         self.profile_editor.mark_profile_changed()
 
     def on_add_menu_condition(self, condition_type_to_add):
+        from pflib.dialogs import (
+            PixelColorConditionDialog, RegionColorConditionDialog, RegionImageConditionDialog,
+            OCRTextMatchConditionDialog, ORConditionDialog
+        )
         dialog = None
         parent_frame = self.profile_editor # Use the stored reference
 
@@ -530,7 +620,7 @@ class MenuPanel(scrolled.ScrolledPanel):
     def on_element_begin_drag(self, event): 
         item_idx, flags = self.elements_list.HitTest(event.GetPoint())
         if item_idx != -1:
-            data_idx = self.elements_list.GetItemData(item_idx)
+            data_idx = self._row_item_data[item_idx]
             if data_idx != -1: 
                 self.drag_element_list_idx = item_idx
                 self.drag_element_start_pos = event.GetPoint()
@@ -545,50 +635,69 @@ class MenuPanel(scrolled.ScrolledPanel):
         if self.drag_element_list_idx is None or not event.Dragging():
             event.Skip(); return
 
+        # Coalesce motion events so the hit-test/indicator redraw runs at most every 16 ms
+        self._element_motion_pos = event.GetPosition()
+        if not self._element_motion_pending:
+            self._element_motion_pending = True
+            wx.CallLater(16, self._process_element_motion)
+        event.Skip()
+    
+    def _process_element_motion(self):
+        if not self or not self._element_motion_pending: return
+        self._element_motion_pending = False
+        if self.drag_element_list_idx is None: return
+        pos = self._element_motion_pos
+
         if not self.dragging_element:
-            if abs(event.GetX() - self.drag_element_start_pos.x) > 5 or \
-               abs(event.GetY() - self.drag_element_start_pos.y) > 5:
+            if abs(pos.x - self.drag_element_start_pos.x) > 5 or \
+               abs(pos.y - self.drag_element_start_pos.y) > 5:
                 self.dragging_element = True
                 self.elements_list.SetCursor(wx.Cursor(wx.CURSOR_HAND))
         
         if self.dragging_element:
-            pos = event.GetPosition()
             item_over_idx, flags = self.elements_list.HitTest(pos)
-
-            if self.drop_element_indicator_line is not None:
-                self.elements_list.Refresh() 
-                self.drop_element_indicator_line = None
-
+            drop_line, line_y = None, None
             if item_over_idx != -1 and item_over_idx != self.drag_element_list_idx:
-                self.drop_element_indicator_line = item_over_idx 
+                drop_line = item_over_idx
                 rect = self.elements_list.GetItemRect(item_over_idx)
-                dc = wx.ClientDC(self.elements_list)
-                dc.SetPen(wx.Pen(wx.BLUE, 2))
-                if pos.y < rect.y + rect.height / 2:
-                    dc.DrawLine(rect.x, rect.y, rect.x + rect.width, rect.y)
-                else:
-                    dc.DrawLine(rect.x, rect.y + rect.height, rect.x + rect.width, rect.y + rect.height)
-        event.Skip()
+                line_y = rect.y if pos.y < rect.y + rect.height / 2 else rect.y + rect.height
+            if (drop_line, line_y) == self._drawn_drop_indicator: return # Indicator has not moved
+            self._drawn_drop_indicator = (drop_line, line_y)
+            self.drop_element_indicator_line = drop_line
+
+            # Draw on an overlay so moving the indicator never invalidates the list rows
+            dc = wx.ClientDC(self.elements_list)
+            overlay_dc = wx.DCOverlay(self._drop_overlay, dc)
+            overlay_dc.Clear()
+            if drop_line is not None:
+                dc.SetPen(self._drop_indicator_pen)
+                dc.DrawLine(rect.x, line_y, rect.x + rect.width, line_y)
+            del overlay_dc
+    
+    def _clear_drop_indicator(self):
+        dc = wx.ClientDC(self.elements_list)
+        overlay_dc = wx.DCOverlay(self._drop_overlay, dc)
+        overlay_dc.Clear()
+        del overlay_dc
+        self._drop_overlay.Reset()
+        self._drawn_drop_indicator = (None, None)
     
     def on_element_left_up(self, event):
+        if self._element_motion_pending: self._process_element_motion() # Drop on the latest hovered row
         if self.dragging_element and self.drag_element_list_idx is not None:
             self.elements_list.SetCursor(wx.Cursor(wx.CURSOR_DEFAULT))
+            self._clear_drop_indicator()
 
             if self.drop_element_indicator_line is not None:
-                self.elements_list.Refresh() 
-
-                src_data_idx = self.elements_list.GetItemData(self.drag_element_list_idx)
-                drop_target_text = self.elements_list.GetItemText(self.drop_element_indicator_line)
+                src_data_idx = self._row_item_data[self.drag_element_list_idx]
+                drop_target_data_idx = self._row_item_data[self.drop_element_indicator_line]
                 
-                if drop_target_text.startswith("---") and drop_target_text.endswith("---"):
-                    target_group_name = drop_target_text.strip("-").strip()
-                    self.move_element_to_group(src_data_idx, target_group_name)
+                if drop_target_data_idx == -1: # Group header
+                    self.move_element_to_group(src_data_idx, self._row_group[self.drop_element_indicator_line])
                 else:
-                    drop_target_data_idx = self.elements_list.GetItemData(self.drop_element_indicator_line)
-                    if drop_target_data_idx != -1: 
-                        rect = self.elements_list.GetItemRect(self.drop_element_indicator_line)
-                        insert_before = event.GetY() < rect.y + rect.height / 2
-                        self.move_element_relative(src_data_idx, drop_target_data_idx, insert_before)
+                    rect = self.elements_list.GetItemRect(self.drop_element_indicator_line)
+                    insert_before = event.GetY() < rect.y + rect.height / 2
+                    self.move_element_relative(src_data_idx, drop_target_data_idx, insert_before)
                 
                 self.update_elements_list() 
                 self.profile_editor.mark_profile_changed()
@@ -602,8 +711,7 @@ class MenuPanel(scrolled.ScrolledPanel):
     def on_element_leave_window(self, event):
         if self.dragging_element:
             self.elements_list.SetCursor(wx.Cursor(wx.CURSOR_DEFAULT))
-            if self.drop_element_indicator_line is not None:
-                self.elements_list.Refresh() 
+            self._clear_drop_indicator()
             self.dragging_element = False
             self.drag_element_list_idx = None
             self.drag_element_start_pos = None
@@ -615,24 +723,14 @@ class MenuPanel(scrolled.ScrolledPanel):
 
         element_to_move = self.menu_data["items"][src_data_idx]
         
-        original_group_of_moved_element = element_to_move[5] if len(element_to_move) > 5 and element_to_move[5] else "default"
+        original_group_of_moved_element = element_to_move[5] or "default"
 
-        if len(element_to_move) <= 5:
-            while len(element_to_move) < 5: element_to_move.append(None)
-            element_to_move.append(target_group_name)
-        else:
-            element_to_move[5] = target_group_name
+        element_to_move[5] = target_group_name
         
         new_display_idx = -10 
-        if len(element_to_move) <= 8:
-            while len(element_to_move) < 8: element_to_move.append(0) 
-            element_to_move.append(new_display_idx)
-        else:
-            element_to_move[8] = new_display_idx
+        element_to_move[8] = new_display_idx
             
-        self.reindex_group_elements(target_group_name) 
-        if original_group_of_moved_element != target_group_name:
-            self.reindex_group_elements(original_group_of_moved_element)
+        self.reindex_group_elements(target_group_name, original_group_of_moved_element)
 
 
     def move_element_relative(self, src_data_idx, target_data_idx, insert_before):
@@ -644,91 +742,110 @@ class MenuPanel(scrolled.ScrolledPanel):
         element_to_move = self.menu_data["items"][src_data_idx]
         target_element = self.menu_data["items"][target_data_idx]
 
-        target_group = target_element[5] if len(target_element) > 5 and target_element[5] else "default"
-        target_display_idx = target_element[8] if len(target_element) > 8 else 0
+        target_group = target_element[5] or "default"
+        target_display_idx = target_element[8]
 
-        original_group_of_moved_element = element_to_move[5] if len(element_to_move) > 5 and element_to_move[5] else "default"
+        original_group_of_moved_element = element_to_move[5] or "default"
 
-        if len(element_to_move) <= 5:
-            while len(element_to_move) < 5: element_to_move.append(None)
-            element_to_move.append(target_group)
-        else:
-            element_to_move[5] = target_group
+        element_to_move[5] = target_group
         
         new_display_idx = target_display_idx - 5 if insert_before else target_display_idx + 5
-        if len(element_to_move) <= 8:
-            while len(element_to_move) < 8: element_to_move.append(0)
-            element_to_move.append(new_display_idx)
-        else:
-            element_to_move[8] = new_display_idx
+        element_to_move[8] = new_display_idx
             
-        self.reindex_group_elements(target_group)
-        if original_group_of_moved_element != target_group:
-            self.reindex_group_elements(original_group_of_moved_element)
+        self.reindex_group_elements(target_group, original_group_of_moved_element)
     
-    def reindex_group_elements(self, group_name_to_reindex):
-        items_in_group = []
-        for i, item_data in enumerate(self.menu_data.get("items", [])):
-            current_item_group = item_data[5] if len(item_data) > 5 and item_data[5] else "default"
-            if current_item_group == group_name_to_reindex:
-                items_in_group.append({
-                    "original_data_idx": i, 
-                    "current_display_idx": item_data[8] if len(item_data) > 8 else 0
-                })
-        
-        items_in_group.sort(key=lambda x: x["current_display_idx"])
-        
-        for new_idx, item_info in enumerate(items_in_group):
-            element_data = self.menu_data["items"][item_info["original_data_idx"]]
-            new_val = new_idx * 10
-            if len(element_data) <= 8:
-                while len(element_data) < 8: element_data.append(0)
-                element_data.append(new_val)
-            else:
-                element_data[8] = new_val
+    def reindex_group_elements(self, *group_names_to_reindex):
+        """Renumber the display indices of the given groups in steps of 10, in one pass over the items"""
+        items_by_group = {group_name: [] for group_name in group_names_to_reindex}
+        for item_data in self.menu_data.get("items", []):
+            group_items = items_by_group.get(item_data[5] or "default")
+            if group_items is not None: group_items.append(item_data)
+        
+        for group_items in items_by_group.values():
+            group_items.sort(key=itemgetter(8))
+            for new_idx, element_data in enumerate(group_items):
+                element_data[8] = new_idx * 10
     
     def get_all_groups(self):
+        """Group names in display order, cached until invalidate_groups() is called"""
+        if self._groups_cache is None:
+            self._groups_cache = self._compute_groups()
+        return self._groups_cache
+    
+    def invalidate_groups(self):
+        self._groups_cache = None
+    
+    def _compute_groups(self):
         group_order_indices = self.menu_data.get("group_order_indices", {"default": 0})
-        item_groups = set(["default"])
+        max_idx = None # Highest order index, found on the first unknown group and then kept up to date
         for item in self.menu_data.get("items", []):
-            g = item[5] if len(item) > 5 and item[5] else "default"
-            item_groups.add(g)
+            g = item[5] or "default"
             if g not in group_order_indices: 
-                max_idx = max(group_order_indices.values() or [-10]) + 10
+                if max_idx is None: max_idx = max(group_order_indices.values(), default=-10)
+                max_idx += 10
                 group_order_indices[g] = max_idx
         
-        sorted_group_names = sorted(group_order_indices.keys(), key=lambda g: group_order_indices.get(g, float('inf')))
+        sorted_group_names = sorted(group_order_indices.keys(), key=group_order_indices.get)
         return sorted_group_names
     
     def on_manage_groups(self, event):
         dialog = GroupManagerDialog(self, self.menu_data, self.menu_id)
-        if dialog.ShowModal() == wx.ID_OK:
-            self.update_elements_list() 
+        result = dialog.ShowModal()
+        self.invalidate_groups() # The dialog edits group order indices in place
+        if result == wx.ID_OK:
+            # One refresh of the group-dependent views for the whole dialog session
             self.update_reset_group_options() 
+            self.rebuild_group_filter()
+            self.update_elements_list() 
             self.profile_editor.mark_profile_changed()
         dialog.Destroy()
     
     def refresh_entire_panel(self):
-        self.update_reset_group_options()
-        self.rebuild_group_filter()
-        self.update_elements_list()
-        self.update_conditions_list()
+        self.invalidate_groups()
+        self.Freeze() # Paint the four sub-refreshes as one
+        try:
+            self.update_reset_group_options()
+            self.rebuild_group_filter()
+            self.update_elements_list()
+            self.update_conditions_list()
+        finally:
+            self.Thaw()
+        # Coalesce the layout/paint of several refreshes in one event-loop pass
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            wx.CallAfter(self._flush_refresh)
+    
+    def _flush_refresh(self):
+        self._refresh_pending = False
+        if not self: return # Panel was destroyed before the call ran
         self.Layout()
         self.Refresh()
     
     def rebuild_group_filter(self):
         old_selection_str = self.group_filter.GetStringSelection()
         fresh_groups = self.get_all_groups()
-        self.group_filter.Clear()
-        self.group_filter.Append("All Groups")
-        self.group_filter.AppendItems(fresh_groups)
-        if old_selection_str in fresh_groups:
-            self.group_filter.SetStringSelection(old_selection_str)
-        else:
-            self.group_filter.SetSelection(0)
+        self.group_filter.Freeze()
+        try:
+            self.group_filter.Clear()
+            self.group_filter.Append("All Groups")
+            self.group_filter.AppendItems(fresh_groups)
+        finally:
+            self.group_filter.Thaw()
+        # Restore the previous selection by position (0 is "All Groups") instead of FindString
+        filter_index = {group: i for i, group in enumerate(fresh_groups, start=1)}
+        self.group_filter.SetSelection(filter_index.get(old_selection_str, 0))
     
     def on_group_filter_changed(self, event):
-        self.update_elements_list()
+        # Debounce so scrolling through the dropdown only rebuilds the list once
+        if self._filter_timer and self._filter_timer.IsRunning():
+            self._filter_timer.Restart(75)
+        else:
+            self._filter_timer = wx.CallLater(75, self._apply_group_filter)
+    
+    def _apply_group_filter(self):
+        # Every data change rebuilds the list itself, so only a different filter needs a rebuild here
+        if self and self.group_filter.GetSelection() != self._rendered_filter_idx:
+            self.update_elements_list()
     
     def on_rename_menu(self, event):
         self.profile_editor.on_rename_menu(event)
@@ -746,8 +863,9 @@ class MenuPanel(scrolled.ScrolledPanel):
         else: event.Skip()
     
     def select_all_conditions(self):
+        select = self.conditions_list.Select
         for i in range(self.conditions_list.GetItemCount()):
-            self.conditions_list.Select(i, True) 
+            select(i, True) 
     
     def on_elements_key(self, event):
         key_code = event.GetKeyCode()
@@ -759,9 +877,10 @@ class MenuPanel(scrolled.ScrolledPanel):
         else: event.Skip()
     
     def select_all_elements(self):
-        for i in range(self.elements_list.GetItemCount()):
-            if self.elements_list.GetItemData(i) != -1: 
-                self.elements_list.Select(i, True)
+        select = self.elements_list.Select
+        for i, data_idx in enumerate(self._row_item_data):
+            if data_idx != -1: 
+                select(i, True)
     
     def on_key_down(self, event): event.Skip()
     
@@ -781,99 +900,109 @@ class MenuPanel(scrolled.ScrolledPanel):
         else: self.reset_group_ctrl.SetValue("default") 
     
     def update_conditions_list(self):
-        self.conditions_list.DeleteAllItems()
-        if "conditions" not in self.menu_data: return
-        for i, condition in enumerate(self.menu_data["conditions"]):
-            condition_type = condition.get("type", "unknown")
-            details = "" 
-            if condition_type == "pixel_color": details = f"({condition['x']},{condition['y']}) RGB{condition['color']} Tol:{condition['tolerance']}"
-            elif condition_type == "pixel_region_color": details = f"Region({condition['x1']},{condition['y1']}-{condition['x2']},{condition['y2']}) RGB{condition['color']} Tol:{condition['tolerance']} Thresh:{condition['threshold']}"
-            elif condition_type == "pixel_region_image": details = f"Region({condition['x1']},{condition['y1']}-{condition['x2']},{condition['y2']}) Conf:{condition['confidence']:.2f} Img:{'Yes' if condition.get('image_data') else 'No'}"
-            elif condition_type == "ocr_text_match": details = f"Region({condition['x1']},{condition['y1']}-{condition['x2']},{condition['y2']}) Text: '{condition.get('expected_text','')[:20]}...'"
-            elif condition_type == "or": details = f"OR (Sub1: {condition['conditions'][0].get('type', 'N/A')}, Sub2: {condition['conditions'][1].get('type', 'N/A')})"
-            else: details = str(condition)[:50]
-            if condition.get("negate"): details = "NOT " + details
+        self.conditions_list.Freeze()
+        try:
+            self.conditions_list.DeleteAllItems()
+            cached_details = self._condition_details
+            fresh_details = {}
+            condition_rows = []
+            for condition in self.menu_data.get("conditions", []):
+                entry = cached_details.get(id(condition))
+                if entry is not None and entry[0] is condition: details = entry[1]
+                else: details = _format_condition_details(condition)
+                fresh_details[id(condition)] = (condition, details)
+                condition_rows.append((condition.get("type", "unknown"), details))
             
-            idx = self.conditions_list.InsertItem(i, condition_type)
-            self.conditions_list.SetItem(idx, 1, details)
+            self._condition_details = fresh_details
+            self._condition_rows = condition_rows
+            self.conditions_list.SetItemCount(len(condition_rows))
+            self.conditions_list.Refresh()
+        finally:
+            self.conditions_list.Thaw()
+    
+    def refresh_condition_row(self, list_idx):
+        """Reformat and redraw one conditions_list row after its condition was edited or replaced"""
+        condition = self.menu_data["conditions"][list_idx]
+        details = _format_condition_details(condition)
+        self._condition_details[id(condition)] = (condition, details)
+        self._condition_rows[list_idx] = (condition.get("type", "unknown"), details)
+        self.conditions_list.RefreshItem(list_idx)
     
     def update_elements_list(self):
-        self.elements_list.DeleteAllItems()
-        if "items" not in self.menu_data: return
-        
-        filter_idx = self.group_filter.GetSelection()
-        selected_group_filter = None
-        if filter_idx > 0: selected_group_filter = self.group_filter.GetString(filter_idx)
-        
-        ordered_groups = self.get_all_groups() 
+        self.elements_list.Freeze()
+        try:
+            self.elements_list.DeleteAllItems()
+            self._row_item_data = []
+            self._row_text = []
+            self._row_group = []
+            # Recorded before any early return so _apply_group_filter never compares against a stale index
+            filter_idx = self.group_filter.GetSelection()
+            self._rendered_filter_idx = filter_idx
+            if "items" not in self.menu_data: return
+        
+            selected_group_filter = None
+            if filter_idx > 0: selected_group_filter = self.group_filter.GetString(filter_idx)
+        
+            ordered_groups = self.get_all_groups() 
 
-        list_ctrl_idx = 0
-        for group_name in ordered_groups:
-            if selected_group_filter and group_name != selected_group_filter:
-                continue
+            # Bucket elements by group in a single pass over the items
+            group_buckets = defaultdict(list)
+            for original_data_idx, element_data in enumerate(self.menu_data["items"]):
+                el_group = element_data[5] or "default"
+                display_idx = element_data[8]
+                group_buckets[el_group].append((display_idx, original_data_idx, element_data))
 
-            header_text = f"--- {group_name} ---"
-            header_list_idx = self.elements_list.InsertItem(list_ctrl_idx, header_text)
-            self.elements_list.SetItemTextColour(header_list_idx, wx.Colour(0, 0, 128))
-            self.elements_list.SetItemBackgroundColour(header_list_idx, wx.Colour(200, 220, 255))
-            self.elements_list.SetItemFont(header_list_idx, wx.Font(wx.NORMAL_FONT.GetPointSize(), wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_BOLD))
-            self.elements_list.SetItemData(header_list_idx, -1) 
-            list_ctrl_idx += 1
+            row_text = []
+            row_item_data = []
+            row_group = []
+            for group_name in ordered_groups:
+                if selected_group_filter and group_name != selected_group_filter:
+                    continue
 
-            items_in_this_group = []
-            for original_data_idx, element_data in enumerate(self.menu_data["items"]):
-                el_group = element_data[5] if len(element_data) > 5 and element_data[5] else "default"
-                if el_group == group_name:
-                    display_idx = element_data[8] if len(element_data) > 8 else 0
-                    items_in_this_group.append({"data": element_data, "original_idx": original_data_idx, "display_idx": display_idx})
-            
-            items_in_this_group.sort(key=lambda x: x["display_idx"])
+                row_text.append((f"--- {group_name} ---", "", "", "", "", "", "", "", ""))
+                row_item_data.append(-1)
+                row_group.append(group_name)
+
+                items_in_this_group = group_buckets.get(group_name, [])
+                items_in_this_group.sort(key=itemgetter(0))
 
-            for item_info in items_in_this_group:
-                element = item_info["data"]
-                el_list_idx = self.elements_list.InsertItem(list_ctrl_idx, element[1]) 
-                self.elements_list.SetItem(el_list_idx, 1, element[2]) 
-                self.elements_list.SetItem(el_list_idx, 2, f"({element[0][0]},{element[0][1]})") 
-                self.elements_list.SetItem(el_list_idx, 3, group_name) 
-                self.elements_list.SetItem(el_list_idx, 4, str(element[4] or "")) 
-                ocr_count = len(element[6]) if len(element) > 6 and element[6] else 0
-                self.elements_list.SetItem(el_list_idx, 5, str(ocr_count) if ocr_count else "") 
-                has_custom_fmt = len(element) > 7 and element[7]
-                self.elements_list.SetItem(el_list_idx, 6, "Yes" if has_custom_fmt else "") 
-                self.elements_list.SetItem(el_list_idx, 7, str(element[8] if len(element) > 8 else 0)) 
-                cond_count = len(element[9]) if len(element) > 9 and element[9] else 0
-                self.elements_list.SetItem(el_list_idx, 8, str(cond_count) if cond_count else "") 
-                self.elements_list.SetItemData(el_list_idx, item_info["original_idx"])
-                list_ctrl_idx += 1
-        
-        self.Layout() 
+                for _, original_data_idx, element in items_in_this_group:
+                    row_text.append(_element_row_text(element, group_name))
+                    row_item_data.append(original_data_idx)
+                row_group.extend([group_name] * len(items_in_this_group))
+        
+            self._row_text = row_text
+            self._row_item_data = row_item_data
+            self._row_group = row_group
+            self.elements_list.SetItemCount(len(row_text))
+            self.elements_list.Refresh()
+        finally:
+            self.elements_list.Thaw()
+        self.Layout()
     
     def on_condition_context_menu(self, event):
         selected_count = self.conditions_list.GetSelectedItemCount()
         if selected_count == 0: return
         menu = wx.Menu()
         if selected_count == 1:
-            edit_item = menu.Append(wx.ID_ANY, "Edit Condition"); self.Bind(wx.EVT_MENU, self.on_edit_condition, edit_item)
+            edit_item = menu.Append(wx.ID_ANY, "Edit Condition"); menu.Bind(wx.EVT_MENU, self.on_edit_condition, edit_item)
         else: 
-            edit_item = menu.Append(wx.ID_ANY, f"Bulk Edit {selected_count} Conditions..."); self.Bind(wx.EVT_MENU, self.on_bulk_edit_conditions, edit_item)
+            edit_item = menu.Append(wx.ID_ANY, f"Bulk Edit {selected_count} Conditions..."); menu.Bind(wx.EVT_MENU, self.on_bulk_edit_conditions, edit_item)
         menu.AppendSeparator()
-        copy_item = menu.Append(wx.ID_ANY, "Copy Condition(s)"); self.Bind(wx.EVT_MENU, self.on_copy_condition, copy_item)
-        delete_item = menu.Append(wx.ID_ANY, "Delete Condition(s)"); self.Bind(wx.EVT_MENU, self.on_delete_condition, delete_item)
+        copy_item = menu.Append(wx.ID_ANY, "Copy Condition(s)"); menu.Bind(wx.EVT_MENU, self.on_copy_condition, copy_item)
+        delete_item = menu.Append(wx.ID_ANY, "Delete Condition(s)"); menu.Bind(wx.EVT_MENU, self.on_delete_condition, delete_item)
         menu.AppendSeparator()
-        paste_item = menu.Append(wx.ID_ANY, "Paste Condition(s)"); self.Bind(wx.EVT_MENU, self.on_paste_condition, paste_item)
+        paste_item = menu.Append(wx.ID_ANY, "Paste Condition(s)"); menu.Bind(wx.EVT_MENU, self.on_paste_condition, paste_item)
         self.PopupMenu(menu); menu.Destroy()
     
     def on_copy_condition(self, event):
         self.profile_editor.clipboard['conditions'] = []
-        item_idx = -1
         count = 0
-        while True:
-            item_idx = self.conditions_list.GetNextItem(item_idx, wx.LIST_NEXT_ALL, wx.LIST_STATE_SELECTED)
-            if item_idx == -1: break
-            condition = copy.deepcopy(self.menu_data["conditions"][item_idx])
+        for item_idx in _iter_selected(self.conditions_list):
+            condition = clone_condition(self.menu_data["conditions"][item_idx])
             self.profile_editor.clipboard['conditions'].append(condition)
             count +=1
-        if count > 0 and self.profile_editor.statusbar: self.profile_editor.statusbar.SetStatusText(f"Copied {count} condition(s)")
+        if count > 0: self.set_status(f"Copied {count} condition(s)")
 
     def on_paste_condition(self, event):
         if not self.profile_editor.clipboard['conditions']:
@@ -883,19 +1012,22 @@ class MenuPanel(scrolled.ScrolledPanel):
         
         insert_after_idx = self.conditions_list.GetFirstSelected() 
         
-        pasted_count = 0
-        for i, condition_to_paste in enumerate(self.profile_editor.clipboard['conditions']):
-            if insert_after_idx != -1:
-                self.menu_data["conditions"].insert(insert_after_idx + 1 + i, copy.deepcopy(condition_to_paste))
-            else: 
-                self.menu_data["conditions"].append(copy.deepcopy(condition_to_paste))
-            pasted_count += 1
+        pasted = [clone_condition(condition) for condition in self.profile_editor.clipboard['conditions']]
+        if insert_after_idx != -1:
+            self.menu_data["conditions"][insert_after_idx + 1:insert_after_idx + 1] = pasted # One shift for the whole batch
+        else: 
+            self.menu_data["conditions"].extend(pasted)
+        pasted_count = len(pasted)
             
         self.update_conditions_list()
         self.profile_editor.mark_profile_changed()
-        if pasted_count > 0 and self.profile_editor.statusbar: self.profile_editor.statusbar.SetStatusText(f"Pasted {pasted_count} condition(s)")
+        if pasted_count > 0: self.set_status(f"Pasted {pasted_count} condition(s)")
     
     def on_edit_condition(self, event):
+        from pflib.dialogs import (
+            PixelColorConditionDialog, RegionColorConditionDialog, RegionImageConditionDialog,
+            OCRTextMatchConditionDialog, ORConditionDialog
+        )
         selected_idx = self.conditions_list.GetFirstSelected()
         if selected_idx == -1: return
         condition = self.menu_data["conditions"][selected_idx]
@@ -910,31 +1042,27 @@ class MenuPanel(scrolled.ScrolledPanel):
         
         if dialog.ShowModal() == wx.ID_OK:
             self.menu_data["conditions"][selected_idx] = dialog.get_condition()
-            self.update_conditions_list()
+            self.refresh_condition_row(selected_idx)
             self.profile_editor.mark_profile_changed()
         dialog.Destroy()
     
     def on_delete_condition(self, event):
         if self.conditions_list.GetSelectedItemCount() == 0: return
-        selected_indices = []
-        item_idx = -1
-        while True:
-            item_idx = self.conditions_list.GetNextItem(item_idx, wx.LIST_NEXT_ALL, wx.LIST_STATE_SELECTED)
-            if item_idx == -1: break
-            selected_indices.append(item_idx)
-        
+        selected_indices = list(_iter_selected(self.conditions_list))
         if not selected_indices: return
         prompt = f"Delete {len(selected_indices)} condition(s)?"
         if wx.MessageBox(prompt, "Confirm Delete", wx.YES_NO | wx.ICON_QUESTION) != wx.YES: return
         
-        for idx in sorted(selected_indices, reverse=True):
-            del self.menu_data["conditions"][idx]
+        delete_set = set(selected_indices)
+        conditions = self.menu_data["conditions"]
+        conditions[:] = [c for i, c in enumerate(conditions) if i not in delete_set]
         
         self.update_conditions_list()
         self.profile_editor.mark_profile_changed()
-        if self.profile_editor.statusbar: self.profile_editor.statusbar.SetStatusText(f"Deleted {len(selected_indices)} condition(s)")
+        self.set_status(f"Deleted {len(selected_indices)} condition(s)")
     
     def on_add_element(self, event):
+        from pflib.dialogs import UIElementDialog
         dialog = UIElementDialog(self.profile_editor, title="Add UI Element") 
         if dialog.ShowModal() == wx.ID_OK:
             element = dialog.get_element()
@@ -945,22 +1073,16 @@ class MenuPanel(scrolled.ScrolledPanel):
             if filter_sel_idx > 0: 
                 target_group = self.group_filter.GetString(filter_sel_idx)
             
-            if len(element) <= 5: element.append(target_group)
-            else: element[5] = target_group
+            element[5] = target_group
 
             max_idx_in_group = -1
             for item_data in self.menu_data["items"]:
-                item_group = item_data[5] if len(item_data) > 5 and item_data[5] else "default"
+                item_group = item_data[5] or "default"
                 if item_group == target_group:
-                    item_display_idx = item_data[8] if len(item_data) > 8 else 0
+                    item_display_idx = item_data[8]
                     max_idx_in_group = max(max_idx_in_group, item_display_idx)
             
-            new_display_idx = max_idx_in_group + 10
-            if len(element) <= 8:
-                while len(element) < 8: element.append(0)
-                element.append(new_display_idx)
-            else:
-                element[8] = new_display_idx
+            element[8] = max_idx_in_group + 10
 
             self.menu_data["items"].append(element)
             self.refresh_entire_panel()
@@ -971,37 +1093,31 @@ class MenuPanel(scrolled.ScrolledPanel):
         selected_count = self.elements_list.GetSelectedItemCount()
         if selected_count == 0: return
         
-        item_idx = -1; has_non_elements = False
-        while True:
-            item_idx = self.elements_list.GetNextItem(item_idx, wx.LIST_NEXT_ALL, wx.LIST_STATE_SELECTED)
-            if item_idx == -1: break
-            if self.elements_list.GetItemData(item_idx) == -1: has_non_elements = True; break
-        if has_non_elements: return 
+        row_item_data = self._row_item_data
+        if any(row_item_data[row] == -1 for row in _iter_selected(self.elements_list)): return
 
         menu = wx.Menu()
         if selected_count == 1:
-            edit_item = menu.Append(wx.ID_ANY, "Edit Element"); self.Bind(wx.EVT_MENU, self.on_edit_element, edit_item)
+            edit_item = menu.Append(wx.ID_ANY, "Edit Element"); menu.Bind(wx.EVT_MENU, self.on_edit_element, edit_item)
         else:
-            edit_item = menu.Append(wx.ID_ANY, f"Bulk Edit {selected_count} Elements..."); self.Bind(wx.EVT_MENU, self.on_bulk_edit_elements, edit_item)
+            edit_item = menu.Append(wx.ID_ANY, f"Bulk Edit {selected_count} Elements..."); menu.Bind(wx.EVT_MENU, self.on_bulk_edit_elements, edit_item)
         menu.AppendSeparator()
-        copy_item = menu.Append(wx.ID_ANY, "Copy Element(s)"); self.Bind(wx.EVT_MENU, self.on_copy_element, copy_item)
-        delete_item = menu.Append(wx.ID_ANY, "Delete Element(s)"); self.Bind(wx.EVT_MENU, self.on_delete_element, delete_item)
+        copy_item = menu.Append(wx.ID_ANY, "Copy Element(s)"); menu.Bind(wx.EVT_MENU, self.on_copy_element, copy_item)
+        delete_item = menu.Append(wx.ID_ANY, "Delete Element(s)"); menu.Bind(wx.EVT_MENU, self.on_delete_element, delete_item)
         menu.AppendSeparator()
-        paste_item = menu.Append(wx.ID_ANY, "Paste Element(s)"); self.Bind(wx.EVT_MENU, self.on_paste_element, paste_item)
+        paste_item = menu.Append(wx.ID_ANY, "Paste Element(s)"); menu.Bind(wx.EVT_MENU, self.on_paste_element, paste_item)
         self.PopupMenu(menu); menu.Destroy()
     
     def on_copy_element(self, event):
         self.profile_editor.clipboard['elements'] = []
-        item_idx = -1; count = 0
-        while True:
-            item_idx = self.elements_list.GetNextItem(item_idx, wx.LIST_NEXT_ALL, wx.LIST_STATE_SELECTED)
-            if item_idx == -1: break
-            data_idx = self.elements_list.GetItemData(item_idx)
+        count = 0
+        for item_idx in _iter_selected(self.elements_list):
+            data_idx = self._row_item_data[item_idx]
             if data_idx != -1: 
-                element = copy.deepcopy(self.menu_data["items"][data_idx])
+                element = clone_element(self.menu_data["items"][data_idx])
                 self.profile_editor.clipboard['elements'].append(element)
                 count += 1
-        if count > 0 and self.profile_editor.statusbar: self.profile_editor.statusbar.SetStatusText(f"Copied {count} element(s)")
+        if count > 0: self.set_status(f"Copied {count} element(s)")
 
     def on_paste_element(self, event):
         if not self.profile_editor.clipboard['elements']:
@@ -1009,10 +1125,7 @@ class MenuPanel(scrolled.ScrolledPanel):
         if "items" not in self.menu_data: self.menu_data["items"] = []
 
         last_selected_list_idx = -1
-        item_idx = -1
-        while True: 
-            item_idx = self.elements_list.GetNextItem(item_idx, wx.LIST_NEXT_ALL, wx.LIST_STATE_SELECTED)
-            if item_idx == -1: break
+        for item_idx in _iter_selected(self.elements_list):
             last_selected_list_idx = item_idx
         
         insert_after_data_idx = -1
@@ -1020,42 +1133,31 @@ class MenuPanel(scrolled.ScrolledPanel):
         current_max_display_idx_in_target_group = -10 
 
         if last_selected_list_idx != -1:
-            data_idx_of_last_selected = self.elements_list.GetItemData(last_selected_list_idx)
+            data_idx_of_last_selected = self._row_item_data[last_selected_list_idx]
             if data_idx_of_last_selected != -1: 
                 insert_after_data_idx = data_idx_of_last_selected
                 target_element = self.menu_data["items"][data_idx_of_last_selected]
-                target_group_for_pasted = target_element[5] if len(target_element) > 5 and target_element[5] else "default"
-                current_max_display_idx_in_target_group = target_element[8] if len(target_element) > 8 else 0
+                target_group_for_pasted = target_element[5] or "default"
+                current_max_display_idx_in_target_group = target_element[8]
             else: 
-                header_text = self.elements_list.GetItemText(last_selected_list_idx)
-                if header_text.startswith("---"):
-                    target_group_for_pasted = header_text.strip("-").strip()
-                min_idx_in_group = float('inf')
-                found_group_items = False
-                for item_d in self.menu_data["items"]:
-                    item_g = item_d[5] if len(item_d) > 5 and item_d[5] else "default"
-                    if item_g == target_group_for_pasted:
-                        found_group_items = True
-                        min_idx_in_group = min(min_idx_in_group, item_d[8] if len(item_d) > 8 else 0)
-                current_max_display_idx_in_target_group = min_idx_in_group - 10 if found_group_items else -10
+                target_group_for_pasted = self._row_group[last_selected_list_idx]
+                # Rows under a header are its group's elements sorted by index, so the first one holds the minimum
+                first_row = last_selected_list_idx + 1
+                first_data_idx = self._row_item_data[first_row] if first_row < len(self._row_item_data) else -1
+                current_max_display_idx_in_target_group = self.menu_data["items"][first_data_idx][8] - 10 if first_data_idx != -1 else -10
         else: 
             if self.menu_data["items"]:
                  last_item = self.menu_data["items"][-1]
-                 target_group_for_pasted = last_item[5] if len(last_item) > 5 and last_item[5] else "default"
-                 current_max_display_idx_in_target_group = last_item[8] if len(last_item) > 8 else 0
+                 target_group_for_pasted = last_item[5] or "default"
+                 current_max_display_idx_in_target_group = last_item[8]
 
         pasted_count = 0
         for element_to_paste_orig in self.profile_editor.clipboard['elements']:
-            element_to_paste = copy.deepcopy(element_to_paste_orig)
-            if len(element_to_paste) <= 5: element_to_paste.append(target_group_for_pasted)
-            else: element_to_paste[5] = target_group_for_pasted
+            element_to_paste = normalize_element(clone_element(element_to_paste_orig))
+            element_to_paste[5] = target_group_for_pasted
             
             current_max_display_idx_in_target_group += 10 
-            if len(element_to_paste) <= 8:
-                while len(element_to_paste) < 8: element_to_paste.append(0)
-                element_to_paste.append(current_max_display_idx_in_target_group)
-            else:
-                element_to_paste[8] = current_max_display_idx_in_target_group
+            element_to_paste[8] = current_max_display_idx_in_target_group
             
             self.menu_data["items"].append(element_to_paste)
             pasted_count += 1
@@ -1063,43 +1165,46 @@ class MenuPanel(scrolled.ScrolledPanel):
         self.reindex_group_elements(target_group_for_pasted) 
         self.refresh_entire_panel()
         self.profile_editor.mark_profile_changed()
-        if pasted_count > 0 and self.profile_editor.statusbar: self.profile_editor.statusbar.SetStatusText(f"Pasted {pasted_count} element(s)")
+        if pasted_count > 0: self.set_status(f"Pasted {pasted_count} element(s)")
     
     def on_edit_element(self, event):
+        from pflib.dialogs import UIElementDialog
         selected_item_list_idx = self.elements_list.GetFirstSelected()
         if selected_item_list_idx == -1: return
-        orig_data_idx = self.elements_list.GetItemData(selected_item_list_idx)
+        orig_data_idx = self._row_item_data[selected_item_list_idx]
         if orig_data_idx == -1: return 
             
         element = self.menu_data["items"][orig_data_idx]
         dialog = UIElementDialog(self.profile_editor, title="Edit UI Element", element=element)
         if dialog.ShowModal() == wx.ID_OK:
-            self.menu_data["items"][orig_data_idx] = dialog.get_element()
-            self.refresh_entire_panel()
+            edited_element = dialog.get_element()
+            self.menu_data["items"][orig_data_idx] = edited_element
+            group_name = edited_element[5] or "default"
+            if group_name == (element[5] or "default") and edited_element[8] == element[8]:
+                # The element keeps its place in the list, so only its own row needs redrawing
+                self._row_text[selected_item_list_idx] = _element_row_text(edited_element, group_name)
+                self.elements_list.RefreshItem(selected_item_list_idx)
+            else:
+                self.refresh_entire_panel()
             self.profile_editor.mark_profile_changed()
         dialog.Destroy()
     
     def on_delete_element(self, event):
         if self.elements_list.GetSelectedItemCount() == 0: return
-        selected_data_indices = []
-        item_idx = -1
-        while True:
-            item_idx = self.elements_list.GetNextItem(item_idx, wx.LIST_NEXT_ALL, wx.LIST_STATE_SELECTED)
-            if item_idx == -1: break
-            data_idx = self.elements_list.GetItemData(item_idx)
-            if data_idx != -1: selected_data_indices.append(data_idx)
+        row_item_data = self._row_item_data
+        selected_data_indices = [row_item_data[row] for row in _iter_selected(self.elements_list) if row_item_data[row] != -1]
         
         if not selected_data_indices: return
         prompt = f"Delete {len(selected_data_indices)} element(s)?"
         if wx.MessageBox(prompt, "Confirm Delete", wx.YES_NO | wx.ICON_QUESTION) != wx.YES: return
         
-        for data_idx_to_delete in sorted(selected_data_indices, reverse=True):
-            if 0 <= data_idx_to_delete < len(self.menu_data["items"]):
-                del self.menu_data["items"][data_idx_to_delete]
+        delete_set = set(selected_data_indices)
+        items = self.menu_data["items"]
+        items[:] = [item for i, item in enumerate(items) if i not in delete_set]
         
         self.refresh_entire_panel()
         self.profile_editor.mark_profile_changed()
-        if self.profile_editor.statusbar: self.profile_editor.statusbar.SetStatusText(f"Deleted {len(selected_data_indices)} element(s)")
+        self.set_status(f"Deleted {len(selected_data_indices)} element(s)")
     
     def on_save(self):
         self.menu_data["reset_index"] = self.reset_index_cb.GetValue()
@@ -1112,96 +1217,85 @@ class MenuPanel(scrolled.ScrolledPanel):
             self.profile_editor.delete_menu(self.menu_id)
     
     def on_bulk_edit_elements(self, event):
-        selected_data_indices = []
-        item_idx = -1
-        while True:
-            item_idx = self.elements_list.GetNextItem(item_idx, wx.LIST_NEXT_ALL, wx.LIST_STATE_SELECTED)
-            if item_idx == -1: break
-            data_idx = self.elements_list.GetItemData(item_idx)
-            if data_idx != -1: selected_data_indices.append(data_idx)
+        from pflib.bulk_edit_dialog import BulkEditElementsDialog
+        row_item_data = self._row_item_data
+        selected_data_indices = [row_item_data[row] for row in _iter_selected(self.elements_list) if row_item_data[row] != -1]
         if not selected_data_indices: return
             
         dialog = BulkEditElementsDialog(self.profile_editor) 
-        all_menu_groups = self.get_all_groups()
-        dialog.group_ctrl.SetItems(all_menu_groups)
-        if dialog.group_ctrl.GetCount() > 0: dialog.group_ctrl.SetSelection(0)
+        try:
+            all_menu_groups = self.get_all_groups()
+            dialog.group_ctrl.SetItems(all_menu_groups)
+            if dialog.group_ctrl.GetCount() > 0: dialog.group_ctrl.SetSelection(0)
 
-        if dialog.ShowModal() == wx.ID_OK:
-            changes = dialog.get_bulk_changes()
-            if not changes: dialog.Destroy(); return
+            if dialog.ShowModal() == wx.ID_OK:
+                changes = dialog.get_bulk_changes()
+                if not changes: return
             
-            modified_count = 0
-            affected_groups = set()
-            for data_idx in selected_data_indices:
-                if 0 <= data_idx < len(self.menu_data["items"]):
-                    element = self.menu_data["items"][data_idx]
-                    original_group = element[5] if len(element) > 5 and element[5] else "default"
-                    affected_groups.add(original_group)
-
-                    if 'type' in changes: element[2] = changes['type']
-                    if 'speaks_on_select' in changes: element[3] = changes['speaks_on_select']
-                    if 'submenu_id' in changes: element[4] = changes['submenu_id']
-                    if 'group' in changes:
-                        new_group = changes['group']
-                        if len(element) <= 5: element.append(new_group)
-                        else: element[5] = new_group
-                        affected_groups.add(new_group)
-                    if changes.get('clear_announcement'):
-                        if len(element) <= 7: element.append(None)
-                        else: element[7] = None
-                    if changes.get('clear_ocr'):
-                        if len(element) <= 6: element.append([])
-                        else: element[6] = []
-                    modified_count += 1
+                # The changes are the same for every element, so resolve them once into (field, value) pairs
+                field_updates = [(field, changes[key]) for field, key in _BULK_ELEMENT_FIELDS if key in changes]
+                if changes.get('clear_announcement'): field_updates.append((7, None))
+                has_group, new_group = 'group' in changes, changes.get('group')
+                clear_ocr = changes.get('clear_ocr')
             
-            for group_to_reindex in affected_groups:
-                self.reindex_group_elements(group_to_reindex)
+                items = self.menu_data["items"]
+                modified_count = 0
+                affected_groups = set()
+                for data_idx in selected_data_indices:
+                    if 0 <= data_idx < len(items):
+                        element = items[data_idx]
+                        affected_groups.add(element[5] or "default")
 
-            self.refresh_entire_panel()
-            self.profile_editor.mark_profile_changed()
-            if modified_count > 0 and self.profile_editor.statusbar: self.profile_editor.statusbar.SetStatusText(f"Bulk edited {modified_count} element(s)")
-        dialog.Destroy()
+                        for field, value in field_updates: element[field] = value
+                        if clear_ocr: element[6] = [] # Fresh list per element
+                        modified_count += 1
+                if has_group: affected_groups.add(new_group)
+            
+                if modified_count > 0:
+                    if has_group:
+                        self.reindex_group_elements(*affected_groups)
+                        self.refresh_entire_panel()
+                    else:
+                        # Group membership is untouched, so only the element rows need redrawing
+                        self.update_elements_list()
+                    self.profile_editor.mark_profile_changed()
+                    self.set_status(f"Bulk edited {modified_count} element(s)")
+        finally:
+            dialog.Destroy()
         
     def on_bulk_edit_conditions(self, event):
-        selected_indices_in_list = [] 
-        item_idx = -1
-        while True:
-            item_idx = self.conditions_list.GetNextItem(item_idx, wx.LIST_NEXT_ALL, wx.LIST_STATE_SELECTED)
-            if item_idx == -1: break
-            selected_indices_in_list.append(item_idx)
+        from pflib.condition_bulk_edit import BulkEditConditionsDialog
+        selected_indices_in_list = list(_iter_selected(self.conditions_list))
         if not selected_indices_in_list: return
 
-        compatible_indices = []
-        for list_idx in selected_indices_in_list:
-            cond_type = self.menu_data["conditions"][list_idx].get("type")
-            if cond_type in ["pixel_color", "pixel_region_color"]: 
-                compatible_indices.append(list_idx)
-        
-        if not compatible_indices:
+        conditions = self.menu_data["conditions"]
+        compatible_types = ("pixel_color", "pixel_region_color")
+        if not any(conditions[list_idx].get("type") in compatible_types for list_idx in selected_indices_in_list):
             wx.MessageBox("Selected conditions are not compatible for this bulk edit (only pixel/region color).", "Bulk Edit", wx.ICON_INFORMATION); return
 
         dialog = BulkEditConditionsDialog(self.profile_editor) 
-        if dialog.ShowModal() == wx.ID_OK:
-            changes = dialog.get_bulk_changes()
-            if not changes: dialog.Destroy(); return
+        try:
+            if dialog.ShowModal() == wx.ID_OK:
+                changes = dialog.get_bulk_changes()
+                if not changes: return
             
-            modified_count = 0
-            for list_idx in compatible_indices: 
-                condition = self.menu_data["conditions"][list_idx]
-                if 'color' in changes: condition['color'] = changes['color']
-                if 'tolerance' in changes: condition['tolerance'] = changes['tolerance']
-                modified_count += 1
+                updates = {key: changes[key] for key in ('color', 'tolerance') if key in changes}
+                modified_count = 0
+                for list_idx in selected_indices_in_list: 
+                    condition = conditions[list_idx]
+                    if condition.get("type") not in compatible_types: continue
+                    condition.update(updates)
+                    self.refresh_condition_row(list_idx)
+                    modified_count += 1
             
-            self.update_conditions_list()
-            self.profile_editor.mark_profile_changed()
-            if modified_count > 0 and self.profile_editor.statusbar: self.profile_editor.statusbar.SetStatusText(f"Bulk edited {modified_count} condition(s)")
-        dialog.Destroy()
+                if modified_count > 0:
+                    self.profile_editor.mark_profile_changed()
+                    self.set_status(f"Bulk edited {modified_count} condition(s)")
+        finally:
+            dialog.Destroy()
     
     def on_reset_index_changed(self, event):
         self.menu_data["reset_index"] = self.reset_index_cb.GetValue()
         self.profile_editor.mark_profile_changed()
         value = "will reset" if self.reset_index_cb.GetValue() else "will maintain"
-        try: 
-            if self.profile_editor and self.profile_editor.statusbar:
-                self.profile_editor.statusbar.SetStatusText(f"Menu '{self.menu_id}' {value} selection index")
-        except: pass
\ No newline at end of file
+        self.set_status(f"Menu '{self.menu_id}' {value} selection index")
\ No newline at end of file
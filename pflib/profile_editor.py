@@ -3,20 +3,25 @@ Profile Editor - Main application frame
 """
 
 import wx
-import wx.adv
 import json
 import os
 import time
 import threading
-import numpy as np
-import copy
 
-from pflib.utils import APP_TITLE, APP_VERSION
+from pflib.utils import APP_TITLE, APP_VERSION, clone_menu, decode_profile, normalize_element, write_profile_file
 from pflib.menu_panel import MenuPanel
-from pflib.menu_condition import MenuCondition # For test menu
 from pflib.ocr_handler import OCRHandler # For test menu with OCR conditions
 from malib.screen_capture import ScreenCapture  # Use unified screen capture
-from PIL import Image
+
+class MenuPlaceholder(wx.Panel):
+    """Empty notebook page that stands in for a menu's MenuPanel until its tab is first shown"""
+    
+    def __init__(self, parent, menu_id):
+        super().__init__(parent)
+        self.menu_id = menu_id
+    
+    def set_menu_id(self, menu_id):
+        self.menu_id = menu_id
 
 class ProfileEditorFrame(wx.Frame):
     """Main frame for the profile editor application"""
@@ -26,7 +31,8 @@ class ProfileEditorFrame(wx.Frame):
         
         self.profile_data = {}
         self.current_file = None
-        self.is_changed = False
+        self._current_basename = "New Profile" # Display name for current_file, see set_current_file
+        self.is_changed = False # Also means the title carries the '*' unsaved marker
         self.clipboard = {
             'menu': None,
             'conditions': [],
@@ -36,6 +42,8 @@ class ProfileEditorFrame(wx.Frame):
         script_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__))) # pflib parent
         self.profiles_dir = os.path.join(script_dir, 'profiles')
         os.makedirs(self.profiles_dir, exist_ok=True)
+        self.config_path = os.path.join(script_dir, 'pflib', 'config.json')
+        self._config = None # Last config read or written, see load_config
 
         # Initialize unified screen capture for editor
         self.screen_capture = ScreenCapture()
@@ -46,6 +54,8 @@ class ProfileEditorFrame(wx.Frame):
         # Start OCR initialization in background if not already done
         if not self.editor_ocr_handler.init_complete.is_set():
              threading.Thread(target=self.editor_ocr_handler.initialize_reader, daemon=True).start()
+        self._condition_checker = None # MenuCondition for "Test Menu", created on first use
+        self._last_saved = None # (path, digest, size, mtime_ns) of the file write_profile last wrote
         
         self.init_ui()
         
@@ -139,6 +149,7 @@ class ProfileEditorFrame(wx.Frame):
         main_sizer.Add(top_sizer, 0, wx.EXPAND | wx.ALL, 10)
         
         self.notebook = wx.Notebook(panel)
+        self.notebook.Bind(wx.EVT_NOTEBOOK_PAGE_CHANGED, self.on_page_changed)
         main_sizer.Add(self.notebook, 1, wx.EXPAND | wx.ALL, 10)
         panel.SetSizer(main_sizer)
         
@@ -155,62 +166,84 @@ class ProfileEditorFrame(wx.Frame):
         return False
     
     def save_config(self):
-        script_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        config_dir = os.path.join(script_dir, 'pflib')
-        os.makedirs(config_dir, exist_ok=True)
-        config_path = os.path.join(config_dir, 'config.json')
         config = {'last_profile': self.current_file}
+        if config == self._config: return # Every save rewrites the same last_profile otherwise
         try:
-            with open(config_path, 'w') as file: json.dump(config, file)
+            os.makedirs(os.path.dirname(self.config_path), exist_ok=True)
+            with open(self.config_path, 'w') as file: json.dump(config, file)
+            self._config = config
         except Exception as e: print(f"Failed to save config: {e}")
     
     def load_config(self):
-        script_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        config_dir = os.path.join(script_dir, 'pflib')
-        config_path = os.path.join(config_dir, 'config.json')
-        config = {'last_profile': None}
-        try:
-            if os.path.exists(config_path):
-                with open(config_path, 'r') as file: config.update(json.load(file))
-        except Exception as e: print(f"Failed to load config: {e}")
-        return config
+        if self._config is None:
+            config = {'last_profile': None}
+            try:
+                if os.path.exists(self.config_path):
+                    with open(self.config_path, 'r') as file: config.update(json.load(file))
+            except Exception as e: print(f"Failed to load config: {e}")
+            self._config = config
+        return dict(self._config)
     
     def load_profile(self, path):
         try:
-            with open(path, 'r') as file: self.profile_data = json.load(file)
-            self.current_file = path
-            self.is_changed = False
+            with open(path, 'rb') as file: self.profile_data = decode_profile(file.read())
+            self.set_current_file(path)
+            self._last_saved = None # The file was read, not written by us
             
-            while self.notebook.GetPageCount() > 0: self.notebook.DeletePage(0)
-            
-            # Ensure default fields exist for older profiles
-            for menu_id, menu_data in self.profile_data.items():
-                menu_data.setdefault("is_manual", False)
-                menu_data.setdefault("reset_index", True)
-                menu_data.setdefault("reset_group", "default")
-                menu_data.setdefault("group_order_indices", {"default": 0}) # Add this
-                menu_data.setdefault("conditions", [])
-                menu_data.setdefault("items", [])
-                for item in menu_data["items"]:
-                    while len(item) < 11: # Ensure 11 fields for items
-                        if len(item) == 6: item.append([])    # ocr_regions
-                        elif len(item) == 7: item.append(None) # custom_announcement
-                        elif len(item) == 8: item.append(0)    # index
-                        elif len(item) == 9: item.append([])    # conditions
-                        elif len(item) == 10: item.append(0)   # ocr_delay_ms
-                        else: item.append(None)
+            self.notebook.Freeze() # Replace all tabs in one repaint
+            try:
+                self.notebook.DeleteAllPages()
+                
+                # Ensure default fields exist for older profiles
+                for menu_id, menu_data in self.profile_data.items():
+                    menu_data.setdefault("is_manual", False)
+                    menu_data.setdefault("reset_index", True)
+                    menu_data.setdefault("reset_group", "default")
+                    menu_data.setdefault("group_order_indices", {"default": 0}) # Add this
+                    menu_data.setdefault("conditions", [])
+                    menu_data.setdefault("items", [])
+                    for item in menu_data["items"]:
+                        normalize_element(item) # Ensure 11 fields for items
 
 
-            for menu_id, menu_data in self.profile_data.items():
-                menu_panel = MenuPanel(self.notebook, menu_id, menu_data, self)
-                self.notebook.AddPage(menu_panel, menu_id)
+                # Only the visible tab gets a real MenuPanel now; the rest are built when first selected
+                for menu_id in self.profile_data:
+                    self.notebook.AddPage(MenuPlaceholder(self.notebook, menu_id), menu_id)
+                if self.notebook.GetPageCount() > 0:
+                    self.realize_page(self.notebook.GetPage(self.notebook.GetSelection()))
+            finally:
+                self.notebook.Thaw()
             
-            self.SetTitle(f"{APP_TITLE} v{APP_VERSION} - {os.path.basename(path)}")
+            self.is_changed = False # After the tabs, so nothing built above leaves the profile dirty
+            self.set_clean_title()
             self.statusbar.SetStatusText(f"Loaded: {path}")
             self.save_config()
         except Exception as e:
             wx.MessageBox(f"Error loading profile: {str(e)}", "Error", wx.ICON_ERROR)
     
+    def on_page_changed(self, event):
+        page_idx = event.GetSelection()
+        if page_idx != -1:
+            page = self.notebook.GetPage(page_idx)
+            # Swap the page outside the notebook's own selection change
+            if isinstance(page, MenuPlaceholder): wx.CallAfter(self.realize_page, page)
+        event.Skip()
+    
+    def realize_page(self, page):
+        """Replace a MenuPlaceholder page with the MenuPanel for its menu"""
+        if not page or not isinstance(page, MenuPlaceholder): return # Already replaced or deleted
+        page_idx = self.notebook.FindPage(page)
+        if page_idx == wx.NOT_FOUND or page.menu_id not in self.profile_data: return
+        menu_panel = MenuPanel(self.notebook, page.menu_id, self.profile_data[page.menu_id], self)
+        self.notebook.Freeze()
+        try:
+            # Runs via CallAfter, so the user may have moved on to another tab already
+            select = self.notebook.GetSelection() == page_idx
+            self.notebook.InsertPage(page_idx, menu_panel, page.menu_id, select=select)
+            self.notebook.DeletePage(page_idx + 1)
+        finally:
+            self.notebook.Thaw()
+    
     def on_copy_menu_menu_item(self, event): self.copy_current_menu()
     def on_paste_menu_menu_item(self, event): self.paste_menu() # Added handler
 
@@ -222,9 +255,6 @@ class ProfileEditorFrame(wx.Frame):
         current_menu_panel = self.notebook.GetPage(current_tab_idx)
         orig_id = current_menu_panel.menu_id
         
-        # Create a deep copy of the menu data
-        menu_data_to_copy = copy.deepcopy(self.profile_data[orig_id])
-        
         suggested_name = f"{orig_id}_copy"
         counter = 1
         while suggested_name in self.profile_data:
@@ -237,9 +267,12 @@ class ProfileEditorFrame(wx.Frame):
             if new_id in self.profile_data:
                 if wx.MessageBox(f"Menu '{new_id}' already exists. Replace?", "Confirm", wx.ICON_QUESTION | wx.YES_NO) != wx.YES:
                     dialog.Destroy(); return
-                self.delete_menu(new_id) # Delete existing if replacing
             
-            self.profile_data[new_id] = menu_data_to_copy # Use the deep copied data
+            # Cloned once, only after the name is confirmed (and before a replaced menu, possibly the original, is deleted)
+            menu_data_to_copy = clone_menu(self.profile_data[orig_id])
+            if new_id in self.profile_data:
+                self.delete_menu(new_id) # Delete existing if replacing
+            self.profile_data[new_id] = menu_data_to_copy
             menu_panel = MenuPanel(self.notebook, new_id, self.profile_data[new_id], self)
             self.notebook.AddPage(menu_panel, new_id)
             self.notebook.SetSelection(self.notebook.GetPageCount() - 1)
@@ -266,11 +299,9 @@ class ProfileEditorFrame(wx.Frame):
             menu_data = self.profile_data.pop(old_id) # Remove old, get data
             self.profile_data[new_id] = menu_data # Add with new ID
             
-            # Update tab
-            self.notebook.DeletePage(current_tab_idx)
-            new_menu_panel = MenuPanel(self.notebook, new_id, self.profile_data[new_id], self)
-            self.notebook.InsertPage(current_tab_idx, new_menu_panel, new_id) # Insert at same position
-            self.notebook.SetSelection(current_tab_idx)
+            # Re-key the existing page; it still edits the same menu_data dict
+            menu_panel.set_menu_id(new_id)
+            self.notebook.SetPageText(self.notebook.FindPage(menu_panel), new_id) # delete_menu may have shifted it
             
             self.mark_profile_changed()
             self.statusbar.SetStatusText(f"Renamed menu from {old_id} to {new_id}")
@@ -281,13 +312,12 @@ class ProfileEditorFrame(wx.Frame):
         if current_tab_idx == -1: return
         menu_panel = self.notebook.GetPage(current_tab_idx)
         menu_id = menu_panel.menu_id
-        self.clipboard['menu'] = {'id': menu_id, 'data': copy.deepcopy(self.profile_data[menu_id])}
+        self.clipboard['menu'] = {'id': menu_id, 'data': clone_menu(self.profile_data[menu_id])}
         self.statusbar.SetStatusText(f"Copied menu: {menu_id}")
 
     def paste_menu(self):
         if not self.clipboard['menu']: wx.MessageBox("No menu in clipboard.", "Error", wx.ICON_INFORMATION); return
         orig_id = self.clipboard['menu']['id']
-        menu_data_to_paste = copy.deepcopy(self.clipboard['menu']['data'])
         
         suggested_name = f"{orig_id}_pasted"
         counter = 1
@@ -303,7 +333,8 @@ class ProfileEditorFrame(wx.Frame):
                     dialog.Destroy(); return
                 self.delete_menu(new_id)
             
-            self.profile_data[new_id] = menu_data_to_paste
+            # Cloned once the name is confirmed; the clipboard snapshot is unaffected by delete_menu above
+            self.profile_data[new_id] = clone_menu(self.clipboard['menu']['data'])
             menu_panel = MenuPanel(self.notebook, new_id, self.profile_data[new_id], self)
             self.notebook.AddPage(menu_panel, new_id)
             self.notebook.SetSelection(self.notebook.GetPageCount() - 1)
@@ -339,21 +370,33 @@ class ProfileEditorFrame(wx.Frame):
         self.mark_profile_changed()
     
     def mark_profile_changed(self):
+        if self.is_changed: return # Title and status already show the unsaved state
         self.is_changed = True
-        title = self.GetTitle()
-        if not title.startswith('*'): self.SetTitle('*' + title)
-        filename = os.path.basename(self.current_file) if self.current_file else "New Profile"
-        self.statusbar.SetStatusText(f"Modified: {filename}")
+        self.SetTitle('*' + self.GetTitle())
+        self.statusbar.SetStatusText(f"Modified: {self._current_basename}")
+    
+    def set_current_file(self, path):
+        """Set current_file and cache the name shown for it in the title and status bar"""
+        self.current_file = path
+        self._current_basename = os.path.basename(path) if path else "New Profile"
+    
+    def set_clean_title(self):
+        """Show the current profile name in the title without the unsaved-changes marker"""
+        self.SetTitle(f"{APP_TITLE} v{APP_VERSION} - {self._current_basename}")
     
     def on_new(self, event):
         if self.is_changed and not self.is_profile_empty():
             if wx.MessageBox("Unsaved changes. Continue?", "Confirm", wx.ICON_QUESTION | wx.YES_NO) != wx.YES: return
         self.profile_data = {}
-        self.current_file = None
-        self.is_changed = False
-        while self.notebook.GetPageCount() > 0: self.notebook.DeletePage(0)
-        self.add_menu("main_menu")
-        self.SetTitle(f"{APP_TITLE} v{APP_VERSION} - New Profile")
+        self.set_current_file(None)
+        self.notebook.Freeze()
+        try:
+            self.notebook.DeleteAllPages()
+            self.add_menu("main_menu")
+        finally:
+            self.notebook.Thaw()
+        self.is_changed = False # add_menu marks the profile changed; the fresh profile starts clean
+        self.set_clean_title()
         self.statusbar.SetStatusText("New Profile")
     
     def on_open(self, event):
@@ -372,9 +415,9 @@ class ProfileEditorFrame(wx.Frame):
             current_page = self.notebook.GetPage(current_tab_idx)
             if hasattr(current_page, 'on_save'): current_page.on_save() # Save active tab's data
         try:
-            with open(self.current_file, 'w') as file: json.dump(self.profile_data, file, indent=2)
+            self.write_profile(self.current_file)
             self.is_changed = False
-            self.SetTitle(f"{APP_TITLE} v{APP_VERSION} - {os.path.basename(self.current_file)}")
+            self.set_clean_title()
             self.statusbar.SetStatusText(f"Saved: {self.current_file}")
             self.save_config()
         except Exception as e: wx.MessageBox(f"Error saving: {e}", "Error", wx.ICON_ERROR)
@@ -392,14 +435,18 @@ class ProfileEditorFrame(wx.Frame):
             path = fd.GetPath()
             if not path.lower().endswith('.json'): path += '.json'
             try:
-                with open(path, 'w') as file: json.dump(self.profile_data, file, indent=2)
-                self.current_file = path
+                self.write_profile(path)
+                self.set_current_file(path)
                 self.is_changed = False
-                self.SetTitle(f"{APP_TITLE} v{APP_VERSION} - {os.path.basename(path)}")
+                self.set_clean_title()
                 self.statusbar.SetStatusText(f"Saved: {path}")
                 self.save_config()
             except Exception as e: wx.MessageBox(f"Error saving as: {e}", "Error", wx.ICON_ERROR)
     
+    def write_profile(self, path):
+        """Write the profile JSON to path, replacing the file only once the new contents are fully written"""
+        self._last_saved = write_profile_file(path, self.profile_data, self._last_saved)
+    
     def on_test_menu(self, event):
         current_tab_idx = self.notebook.GetSelection()
         if current_tab_idx == -1: wx.MessageBox("No menu selected.", "Error", wx.ICON_ERROR); return
@@ -426,32 +473,46 @@ class ProfileEditorFrame(wx.Frame):
         sizer.Add(close_btn, 0, wx.ALIGN_RIGHT | wx.ALL, 10)
         panel.SetSizer(sizer)
         
-        # Pass the editor's OCR handler to MenuCondition for testing
-        condition_checker = MenuCondition(ocr_handler=self.editor_ocr_handler)
+        # One checker per editor, sharing its screen capture and OCR handler across test runs
+        if self._condition_checker is None:
+            from pflib.menu_condition import MenuCondition # Pulls in OpenCV, so only loaded once a menu is tested
+            self._condition_checker = MenuCondition(ocr_handler=self.editor_ocr_handler, screen_capture=self.screen_capture)
+        condition_checker = self._condition_checker
+        
+        def show_results(rows, all_passed):
+            if not results_list: return # Dialog was closed before the test finished
+            results_list.Freeze()
+            try:
+                for i, (cond_type_str, result_str, details_str) in enumerate(rows):
+                    results_list.InsertItem(i, cond_type_str)
+                    results_list.SetItem(i, 1, result_str)
+                    results_list.SetItem(i, 2, details_str)
+            finally:
+                results_list.Thaw()
+            if all_passed:
+                overall_result_text.SetLabel("RESULT: ALL CONDITIONS PASSED - Menu is active")
+                overall_result_text.SetForegroundColour(wx.Colour(0, 128, 0))
+            else:
+                overall_result_text.SetLabel("RESULT: SOME FAILED - Menu not active")
+                overall_result_text.SetForegroundColour(wx.Colour(192, 0, 0))
+            status_text.SetLabel("Test completed.")
         
         def run_test_thread():
             try:
                 screenshot_pil = self.screen_capture.capture() # Use unified screen capture
                 all_passed = True
-                for i, condition_item in enumerate(menu_data["conditions"]): # Renamed
+                rows = []
+                for condition_item in menu_data["conditions"]: # Renamed
                     result = condition_checker.check_condition(condition_item, screenshot_pil)
                     
                     cond_type_str = condition_item.get("type", "N/A")
                     details_str = str(condition_item)[:50] # Basic details
                     if condition_item.get("negate"): cond_type_str = "NOT " + cond_type_str
 
-                    wx.CallAfter(results_list.InsertItem, i, cond_type_str)
-                    wx.CallAfter(results_list.SetItem, i, 1, "PASSED" if result else "FAILED")
-                    wx.CallAfter(results_list.SetItem, i, 2, details_str)
+                    rows.append((cond_type_str, "PASSED" if result else "FAILED", details_str))
                     all_passed = all_passed and result
                 
-                if all_passed:
-                    wx.CallAfter(overall_result_text.SetLabel, "RESULT: ALL CONDITIONS PASSED - Menu is active")
-                    wx.CallAfter(overall_result_text.SetForegroundColour, wx.Colour(0, 128, 0))
-                else:
-                    wx.CallAfter(overall_result_text.SetLabel, "RESULT: SOME FAILED - Menu not active")
-                    wx.CallAfter(overall_result_text.SetForegroundColour, wx.Colour(192, 0, 0))
-                wx.CallAfter(status_text.SetLabel, "Test completed.")
+                wx.CallAfter(show_results, rows, all_passed) # One post to the UI thread for the whole outcome
             except Exception as e_test:
                  wx.CallAfter(status_text.SetLabel, f"Test Error: {e_test}")
 
@@ -470,7 +531,6 @@ class ProfileEditorFrame(wx.Frame):
                 with open(path, 'w') as file: file.write(py_code)
                 self.statusbar.SetStatusText(f"Exported to: {path}")
                 if wx.MessageBox(f"Exported to {path}\nOpen file?", "Success", wx.YES_NO | wx.ICON_QUESTION) == wx.YES:
-                    import os
                     import sys
                     import subprocess
                     if os.name == 'nt': os.startfile(path) # Windows
@@ -492,37 +552,29 @@ class ProfileEditorFrame(wx.Frame):
         menu_ids = sorted(self.profile_data.keys())
         for menu_id in menu_ids:
             menu_data = self.profile_data[menu_id]
-            code.append(f'    "{menu_id}": {{')
+            code.append(f'    {menu_id!r}: {{')
             code.append(f'        "is_manual": {menu_data.get("is_manual", False)},')
             code.append(f'        "reset_index": {menu_data.get("reset_index", True)},')
-            code.append(f'        "reset_group": "{menu_data.get("reset_group", "default")}",')
-            code.append(f'        "group_order_indices": {json.dumps(menu_data.get("group_order_indices", {"default":0}))},')
+            code.append(f'        "reset_group": {menu_data.get("reset_group", "default")!r},')
+            code.append(f'        "group_order_indices": {menu_data.get("group_order_indices", {"default":0})!r},')
 
             if "conditions" in menu_data and menu_data["conditions"]:
                 code.append('        "conditions": [')
-                for condition in menu_data["conditions"]:
-                    code.append(f'            {json.dumps(condition)},')
+                code.extend(f'            {condition!r},' for condition in menu_data["conditions"])
                 code.append('        ],')
             else: code.append('        "conditions": [],')
             
             if "items" in menu_data and menu_data["items"]:
                 code.append('        "items": [')
                 for item in menu_data["items"]:
-                    # Ensure item is a list and has enough elements before accessing
-                    item_str_parts = []
+                    # Items are normalized to all 11 fields on load and edit; repr() quotes and escapes
+                    # every field so the output stays valid Python (True/None rather than JSON literals)
                     if isinstance(item, list):
-                        item_str_parts.append(f"({item[0][0]}, {item[0][1]})" if len(item) > 0 and isinstance(item[0], (list, tuple)) and len(item[0]) == 2 else "(0,0)")
-                        item_str_parts.append(f'"{item[1]}"' if len(item) > 1 else '"Unknown"')
-                        item_str_parts.append(f'"{item[2]}"' if len(item) > 2 else '"button"')
-                        item_str_parts.append(f'{item[3]}' if len(item) > 3 else 'False')
-                        item_str_parts.append(f'{repr(item[4])}' if len(item) > 4 else 'None')
-                        item_str_parts.append(f'"{item[5]}"' if len(item) > 5 and item[5] else '"default"')
-                        item_str_parts.append(f'{json.dumps(item[6])}' if len(item) > 6 and item[6] else '[]')
-                        item_str_parts.append(f'{repr(item[7])}' if len(item) > 7 else 'None')
-                        item_str_parts.append(f'{item[8]}' if len(item) > 8 else '0')
-                        item_str_parts.append(f'{json.dumps(item[9])}' if len(item) > 9 and item[9] else '[]')
-                        item_str_parts.append(f'{item[10]}' if len(item) > 10 else '0')
-                        code.append(f'            [{", ".join(item_str_parts)}],')
+                        pos = item[0]
+                        coords = (pos[0], pos[1]) if isinstance(pos, (list, tuple)) and len(pos) == 2 else (0, 0)
+                        row = [coords, item[1], item[2], item[3], item[4], item[5] or "default",
+                               item[6] or [], item[7], item[8], item[9] or [], item[10]]
+                        code.append(f'            {row!r},')
                     else: # Should not happen with proper data
                         code.append(f'            # Malformed item: {item}')
 
@@ -542,6 +594,7 @@ class ProfileEditorFrame(wx.Frame):
         return '\n'.join(code)
 
     def on_about(self, event):
+        import wx.adv
         info = wx.adv.AboutDialogInfo()
         info.SetName(APP_TITLE); info.SetVersion(APP_VERSION)
         info.SetDescription("Profile editor for MenuAccess."); info.SetCopyright("(C) 2025")
@@ -2,8 +2,18 @@
 UI Components for the Profile Creator application
 """
 
+import logging
 import wx
-import pyautogui
+
+logger = logging.getLogger("AccessibleMenuNav")
+
+# MSS lets the cursor tracker keep one capture session open instead of starting one per tick
+try:
+    import mss
+    from mss.exception import ScreenShotError
+    MSS_AVAILABLE = True
+except ImportError:
+    MSS_AVAILABLE = False
 
 class ColorDisplay(wx.Panel):
     """Panel that displays a color with label"""
@@ -12,31 +22,41 @@ class ColorDisplay(wx.Panel):
         super().__init__(parent, id, size=(-1, 30))
         self.color = initial_color
         self.SetBackgroundColour(wx.Colour(*initial_color))
+        self._cache_label()
         
         # Add a border
         self.SetWindowStyle(wx.BORDER_SIMPLE)
         
+        # on_paint fills the background into a buffer itself, so skip the separate erase pass
+        self.SetBackgroundStyle(wx.BG_STYLE_PAINT)
+        
         # Bind paint event to show RGB values
         self.Bind(wx.EVT_PAINT, self.on_paint)
     
+    def _cache_label(self):
+        """Work out the label and its text color once per color change rather than per paint"""
+        r, g, b = self.color
+        # Set text color to be visible on the background (brightness > 128, scaled by 1000)
+        self._text_color = wx.BLACK if r * 299 + g * 587 + b * 114 > 128000 else wx.WHITE
+        self._label = f"RGB: {r}, {g}, {b}"
+        self._text_extent = None # Measured on the next paint
+    
     def on_paint(self, event):
-        dc = wx.PaintDC(self)
+        dc = wx.AutoBufferedPaintDC(self)
+        dc.SetBackground(wx.Brush(self.GetBackgroundColour()))
+        dc.Clear()
         w, h = self.GetSize()
         
-        # Set text color to be visible on the background
-        r, g, b = self.color
-        brightness = (r * 299 + g * 587 + b * 114) / 1000
-        text_color = wx.BLACK if brightness > 128 else wx.WHITE
-        
-        dc.SetTextForeground(text_color)
-        color_text = f"RGB: {self.color[0]}, {self.color[1]}, {self.color[2]}"
+        dc.SetTextForeground(self._text_color)
         
         # Center the text
-        text_width, text_height = dc.GetTextExtent(color_text)
+        if self._text_extent is None:
+            self._text_extent = dc.GetTextExtent(self._label)
+        text_width, text_height = self._text_extent
         x = (w - text_width) // 2
         y = (h - text_height) // 2
         
-        dc.DrawText(color_text, x, y)
+        dc.DrawText(self._label, x, y)
     
     def GetColor(self):
         return self.color
@@ -44,6 +64,7 @@ class ColorDisplay(wx.Panel):
     def SetColor(self, color):
         self.color = color
         self.SetBackgroundColour(wx.Colour(*color))
+        self._cache_label()
         self.Refresh()  # Force a repaint to update the text
 
 
@@ -51,6 +72,10 @@ class CursorTracker(wx.Frame):
     """
     Floating window that tracks the cursor and shows info about the pixel under it
     """
+    ACTIVE_INTERVAL_MS = 50  # 20 updates per second while the cursor or pixel is changing
+    IDLE_INTERVAL_MS = 250   # Slower polling once nothing has changed for IDLE_TICKS ticks
+    IDLE_TICKS = 10
+    
     def __init__(self, parent=None):
         super().__init__(
             parent, 
@@ -123,6 +148,30 @@ class CursorTracker(wx.Frame):
         self.timer = wx.Timer(self)
         self.Bind(wx.EVT_TIMER, self.on_timer, self.timer)
         
+        # Persistent 1x1 grabber, re-pointed at the cursor each tick
+        self._sct = None
+        if MSS_AVAILABLE:
+            try:
+                self._sct = mss.mss()
+            except Exception as e: # e.g. ScreenShotError with no X display; the pyautogui path still works
+                logger.warning(f"MSS unavailable for the cursor tracker, using pyautogui: {e}")
+        self._grab_region = {"left": 0, "top": 0, "width": 1, "height": 1}
+        
+        # Last values shown, so ticks where nothing changed skip the widget updates
+        self._last_pos = None
+        self._last_color = None
+        self._last_win_pos = None
+        self._colour = wx.Colour()
+        self._idle_ticks = 0
+        self._grab_error_reported = False # Report a failing grab once per tracking session, not on every tick
+        self.Bind(wx.EVT_WINDOW_DESTROY, self.on_destroy)
+        
+        # Screen and window sizes for placement, refreshed when they change rather than queried per tick
+        self._screen_size = wx.DisplaySize()
+        self._window_size = self.GetSize()
+        self.Bind(wx.EVT_DISPLAY_CHANGED, self.on_display_changed)
+        self.Bind(wx.EVT_SIZE, self.on_size)
+        
         # Track active state
         self.is_active = False
         
@@ -131,7 +180,8 @@ class CursorTracker(wx.Frame):
     
     def start_tracking(self):
         """Start tracking the cursor"""
-        self.timer.Start(50)  # Update 20 times per second
+        self.timer.Start(self.ACTIVE_INTERVAL_MS)
+        self._idle_ticks = 0
         self.is_active = True
         
         # Make sure the window is fully rendered before showing
@@ -141,14 +191,24 @@ class CursorTracker(wx.Frame):
         self.Thaw()
         
         # Reset the window position offscreen to avoid flash
-        screen_width, screen_height = wx.DisplaySize()
+        self._screen_size = wx.DisplaySize() # Not every platform sends EVT_DISPLAY_CHANGED
         self.SetPosition((-1000, -1000))
         
         # Then show it
         self.Show()
         
-        # Force an immediate update
-        self.timer.Notify()
+        # Forget what was last shown so the first tick moves the window back on screen
+        self._last_pos = None
+        self._last_color = None
+        self._last_win_pos = None
+        self._grab_error_reported = False
+        
+        # First update once the window has been shown, rather than grabbing before it paints
+        wx.CallAfter(self._first_tick)
+    
+    def _first_tick(self):
+        if self and self.is_active: # Tracking may have stopped, or the window gone, in the meantime
+            self.on_timer(None)
     
     def stop_tracking(self):
         """Stop tracking the cursor"""
@@ -156,32 +216,74 @@ class CursorTracker(wx.Frame):
         self.is_active = False
         self.Hide()
     
+    def on_destroy(self, event):
+        """Release the capture session along with the window"""
+        if event.GetEventObject() is self and self._sct is not None:
+            self.timer.Stop()
+            self._sct.close()
+            self._sct = None
+        event.Skip()
+    
+    def on_display_changed(self, event):
+        self._screen_size = wx.DisplaySize()
+        event.Skip()
+    
+    def on_size(self, event):
+        self._window_size = event.GetSize()
+        event.Skip() # Let the frame lay out its panel
+    
+    def _grab_pixel(self, x, y):
+        """Return the (r, g, b) of the screen pixel at (x, y), or None if it can't be captured"""
+        if self._sct is not None:
+            self._grab_region["left"] = x
+            self._grab_region["top"] = y
+            try:
+                raw = self._sct.grab(self._grab_region).raw # One BGRA pixel
+                return (raw[2], raw[1], raw[0])
+            except (ScreenShotError, OSError) as e:
+                self._report_grab_error(e) # Fall back to pyautogui below
+        try:
+            # Deferred so importing ColorDisplay doesn't pull in pyautogui and its backends
+            import pyautogui
+            return pyautogui.screenshot(region=(x, y, 1, 1)).getpixel((0, 0))[:3]
+        except Exception as e: # Last resort: pyscreeze/PIL raise their own types, e.g. off the primary monitor
+            self._report_grab_error(e)
+            return None
+    
+    def _report_grab_error(self, error):
+        if not self._grab_error_reported:
+            logger.warning(f"Cursor tracker could not capture the pixel under the cursor: {error}")
+            self._grab_error_reported = True
+    
     def on_timer(self, event):
         """Update the tracker with current cursor info"""
-        # Get current mouse position
-        x, y = pyautogui.position()
+        # Get current mouse position (GetCursorPos on Windows, same as pyautogui.position)
+        cursor_pos = wx.GetMousePosition()
+        x, y = cursor_pos.x, cursor_pos.y
+        moved = (x, y) != self._last_pos
         
         # Update position text
-        self.pos_text.SetLabel(f"Position: ({x}, {y})")
+        if moved:
+            self.pos_text.SetLabel(f"Position: ({x}, {y})")
         
         # Get pixel color
-        try:
-            screenshot = pyautogui.screenshot(region=(x, y, 1, 1))
-            pixel_color = screenshot.getpixel((0, 0))
-            
-            # Update color display with bold border
-            self.color_display.SetBackgroundColour(wx.Colour(*pixel_color))
-            
-            # Update RGB text - make it easier to read
+        pixel_color = self._grab_pixel(x, y)
+        if pixel_color is None: return # Nothing could capture it this tick; keep polling
+        
+        # Only repaint the swatch and RGB text when the color actually changed
+        color_changed = pixel_color != self._last_color
+        if color_changed:
             r, g, b = pixel_color
+            self._colour.Set(r, g, b)
+            self.color_display.SetBackgroundColour(self._colour)
+            self.color_display.Refresh()
             self.rgb_text.SetLabel(f"RGB: ({r}, {g}, {b})")
-            
+            self._last_color = pixel_color
+        
+        if moved:
             # Position window near cursor but not directly under it
-            screen_width, screen_height = wx.DisplaySize()
-            window_width, window_height = self.GetSize()
-            
-            # Get current cursor position
-            cursor_pos = wx.GetMousePosition()
+            screen_width, screen_height = self._screen_size
+            window_width, window_height = self._window_size
             
             # Calculate position to keep window on screen
             pos_x = min(cursor_pos.x + 20, screen_width - window_width)
@@ -194,14 +296,18 @@ class CursorTracker(wx.Frame):
             if pos_y + window_height > screen_height:
                 pos_y = cursor_pos.y - window_height - 10
                 
-            # Set new position
-            self.SetPosition((pos_x, pos_y))
-            
-            # Force redraw
-            self.Refresh()
-            self.Update()
-            
-        except Exception as e:
-            # Log error but continue
-            print(f"Cursor tracker error: {e}")
-            pass
\ No newline at end of file
+            # Set new position (unchanged while the cursor slides along a screen edge)
+            if (pos_x, pos_y) != self._last_win_pos:
+                self.SetPosition((pos_x, pos_y))
+                self._last_win_pos = (pos_x, pos_y)
+            self._last_pos = (x, y)
+        
+        # Poll fast while things change and back off once the cursor rests
+        if moved or color_changed:
+            self._idle_ticks = 0
+            if self.timer.GetInterval() != self.ACTIVE_INTERVAL_MS:
+                self.timer.Start(self.ACTIVE_INTERVAL_MS)
+        else:
+            self._idle_ticks += 1
+            if self._idle_ticks == self.IDLE_TICKS:
+                self.timer.Start(self.IDLE_INTERVAL_MS)
@@ -2,12 +2,26 @@
 Utilities for the Profile Creator application
 """
 
-import wx
+import hashlib
+import json
+import os
+
+# orjson is optional; when installed it loads and saves large profiles several times faster
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Constants for application
 APP_TITLE = "MenuAccess Profile Editor"
 APP_VERSION = "1"
 
+# Number of fields in a UI element list:
+# pos, name, type, speaks_on_select, submenu_id, group, ocr_regions,
+# custom_announcement, index, conditions, ocr_delay_ms
+ELEMENT_FIELD_COUNT = 11
+
 # Global cursor tracker instance
 global_cursor_tracker = None
 
@@ -20,9 +34,140 @@ def get_cursor_tracker():
     """
     global global_cursor_tracker
     
-    # Avoid circular import by importing here
+    # Imported here so modules that only need the constants or element helpers don't load wx/mss
     from pflib.ui_components import CursorTracker
     
-    if global_cursor_tracker is None or not wx.GetApp():
+    # A tracker whose window was destroyed (e.g. with a previous wx.App) is falsy, so it is rebuilt too
+    if not global_cursor_tracker:
         global_cursor_tracker = CursorTracker()
-    return global_cursor_tracker
\ No newline at end of file
+    return global_cursor_tracker
+
+def normalize_element(element):
+    """
+    Pad an element list in place to the full ELEMENT_FIELD_COUNT layout
+    
+    Args:
+        element (list): Element list, possibly from an older profile
+        
+    Returns:
+        list: The same element list
+    """
+    if len(element) < ELEMENT_FIELD_COUNT:
+        element.extend(
+            [] if field in (6, 9) else 0 if field in (8, 10) else None # ocr_regions/conditions, index/ocr_delay_ms
+            for field in range(len(element), ELEMENT_FIELD_COUNT)
+        )
+    return element
+
+def clone_condition(condition):
+    """
+    Copy a condition dict, including its color and any nested sub-conditions
+    
+    Args:
+        condition (dict): Condition or OCR region dict
+        
+    Returns:
+        dict: An independent copy of the condition
+    """
+    clone = dict(condition)
+    if clone.get("color") is not None: clone["color"] = list(clone["color"])
+    if clone.get("conditions"): clone["conditions"] = [clone_condition(c) for c in clone["conditions"]]
+    return clone
+
+def clone_element(element):
+    """
+    Copy an element list, cloning its position, OCR regions and conditions
+    
+    Args:
+        element (list): UI element list
+        
+    Returns:
+        list: An independent copy of the element
+    """
+    clone = list(element)
+    clone[0] = list(clone[0])
+    if len(clone) > 6 and clone[6]:
+        clone[6] = [clone_condition(region) for region in clone[6]] # OCR region dicts nest "conditions" too
+    if len(clone) > 9 and clone[9]:
+        clone[9] = [clone_condition(c) for c in clone[9]]
+    return clone
+
+def clone_menu(menu_data):
+    """
+    Copy a menu dict, cloning its conditions, items and group order
+    
+    Args:
+        menu_data (dict): Menu data from a profile
+        
+    Returns:
+        dict: An independent copy of the menu
+    """
+    clone = dict(menu_data)
+    if "conditions" in clone: clone["conditions"] = [clone_condition(c) for c in clone["conditions"]]
+    if "items" in clone: clone["items"] = [clone_element(e) for e in clone["items"]]
+    if "group_order_indices" in clone: clone["group_order_indices"] = dict(clone["group_order_indices"])
+    return clone
+
+def decode_profile(raw):
+    """
+    Parse profile JSON read from disk
+    
+    Args:
+        raw (bytes): Contents of the profile file
+        
+    Returns:
+        dict: Profile data keyed by menu id
+    """
+    return orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+
+def encode_profile(profile_data):
+    """
+    Serialize profile data to the bytes written to disk
+    
+    orjson writes non-ASCII text as raw UTF-8, but profile readers (the navigator, older
+    editors) open files with the locale encoding, so such profiles keep json's \\uXXXX escapes.
+    
+    Args:
+        profile_data (dict): Profile data keyed by menu id
+        
+    Returns:
+        bytes: Pretty-printed, ASCII-only JSON
+    """
+    data = orjson.dumps(profile_data, option=orjson.OPT_INDENT_2) if ORJSON_AVAILABLE else None
+    if data is None or not data.isascii():
+        data = json.dumps(profile_data, indent=2).encode('ascii')
+    return data
+
+def write_profile_file(path, profile_data, last_saved=None):
+    """
+    Write profile data to path, replacing the file only once the new contents are fully written
+    
+    The write is skipped when the bytes match the previous write and the file on disk is still
+    the one that write produced (same size and mtime).
+    
+    Args:
+        path (str): Profile file path
+        profile_data (dict): Profile data keyed by menu id
+        last_saved (tuple): Record returned by the previous call, or None
+        
+    Returns:
+        tuple: (path, digest, size, mtime_ns) record to pass as last_saved next time
+    """
+    data = encode_profile(profile_data)
+    digest = hashlib.blake2b(data, digest_size=16).digest()
+    if last_saved and last_saved[:2] == (path, digest):
+        try:
+            stat = os.stat(path)
+            # Only skip if the file is still the one we wrote, not edited or replaced since
+            if (stat.st_size, stat.st_mtime_ns) == last_saved[2:]: return last_saved
+        except OSError:
+            pass # Deleted since; write it again
+    tmp_path = path + '.tmp'
+    try:
+        with open(tmp_path, 'wb') as file: file.write(data)
+        os.replace(tmp_path, path) # Atomic, so a crash mid-save never leaves a half-written profile
+    except Exception:
+        if os.path.exists(tmp_path): os.remove(tmp_path)
+        raise
+    stat = os.stat(path)
+    return (path, digest, stat.st_size, stat.st_mtime_ns)
@@ -0,0 +1,64 @@
+"""
+Tests for the vectorized region color check in pflib.menu_condition
+"""
+
+import pytest
+
+pytest.importorskip("numpy")
+pytest.importorskip("cv2")
+Image = pytest.importorskip("PIL.Image")
+
+from pflib.menu_condition import MenuCondition
+
+RED = (255, 0, 0)
+BLUE = (0, 0, 255)
+
+
+@pytest.fixture
+def checker():
+    # Any object will do: the region check never captures, it reads the screenshot it is given
+    return MenuCondition(screen_capture=object())
+
+
+def region_condition(color, tolerance=10, threshold=0.5, box=(0, 0, 10, 10)):
+    x1, y1, x2, y2 = box
+    return {"type": "pixel_region_color", "x1": x1, "y1": y1, "x2": x2, "y2": y2,
+            "color": list(color), "tolerance": tolerance, "threshold": threshold}
+
+
+def test_solid_region_matches_its_color(checker):
+    image = Image.new("RGB", (20, 20), RED)
+    assert checker.check_condition(region_condition(RED), image)
+    assert not checker.check_condition(region_condition(BLUE), image)
+
+
+def test_rgba_screenshots_are_sampled_as_rgb(checker):
+    image = Image.new("RGBA", (20, 20), RED + (128,))
+    assert checker.check_condition(region_condition(RED), image)
+
+
+def test_hue_difference_wraps_around_red(checker):
+    # Hues just either side of 0/180 are neighbours, not opposite ends of the scale
+    image = Image.new("RGB", (20, 20), (255, 0, 8))
+    assert checker.check_condition(region_condition((255, 8, 0), tolerance=10), image)
+
+
+def test_invalid_region_does_not_match(checker):
+    image = Image.new("RGB", (20, 20), RED)
+    assert not checker.check_condition(region_condition(RED, box=(5, 5, 30, 30)), image)
+    assert not checker.check_condition(region_condition(RED, box=(8, 8, 4, 4)), image)
+
+
+# Small (corner/center samples), medium (3x3 grid) and large (adaptive grid) regions straddling the edge
+@pytest.mark.parametrize("box", [(115, 0, 125, 10), (60, 5, 180, 105), (0, 0, 220, 220)])
+@pytest.mark.parametrize("threshold", [0.2, 0.5, 0.8])
+def test_region_agrees_with_per_pixel_checks(checker, box, threshold):
+    image = Image.new("RGB", (240, 240), BLUE)
+    # Paint the left half red so the sample points split between matching and not
+    image.paste(RED, (0, 0, 120, 240))
+    x1, y1, x2, y2 = box
+    result = checker.check_condition(region_condition(RED, threshold=threshold, box=box), image)
+
+    samples = checker._sample_positions[(x1, y1, x2, y2)]
+    matches = sum(checker._check_pixel_color(image, x1 + px, y1 + py, list(RED), 10) for px, py in samples)
+    assert result == (matches / len(samples) >= threshold)
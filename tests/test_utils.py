@@ -0,0 +1,174 @@
+"""
+Tests for the pure profile helpers in pflib.utils
+"""
+
+import json
+import os
+
+import pytest
+
+from pflib import utils
+from pflib.utils import (
+    ELEMENT_FIELD_COUNT, clone_condition, clone_element, clone_menu,
+    decode_profile, encode_profile, normalize_element, write_profile_file
+)
+
+
+def make_element():
+    return [
+        [10, 20], "Play", "button", True, None, "main",
+        [{"x1": 0, "y1": 0, "x2": 5, "y2": 5, "conditions": [{"type": "pixel_color", "color": [1, 2, 3]}]}],
+        "Start the game", 2,
+        [{"type": "pixel_color", "x": 1, "y": 2, "color": [255, 0, 0], "tolerance": 10}],
+        150,
+    ]
+
+
+def make_profile():
+    return {
+        "main_menu": {
+            "is_manual": False,
+            "reset_index": True,
+            "reset_group": "main",
+            "group_order_indices": {"default": 0, "main": 1},
+            "conditions": [{"type": "or", "conditions": [{"type": "pixel_color", "color": [9, 9, 9]}]}],
+            "items": [make_element()],
+        }
+    }
+
+
+class TestNormalizeElement:
+    def test_pads_short_element_with_field_defaults(self):
+        element = [[1, 2], "Name", "button", False, None]
+        assert normalize_element(element) is element
+        assert element == [[1, 2], "Name", "button", False, None, None, [], None, 0, [], 0]
+        assert len(element) == ELEMENT_FIELD_COUNT
+
+    def test_padded_lists_are_not_shared(self):
+        first = normalize_element([[0, 0], "A", "button", False, None])
+        second = normalize_element([[0, 0], "B", "button", False, None])
+        first[6].append({"x1": 0})
+        assert second[6] == []
+        assert first[6] is not first[9]
+
+    def test_full_element_is_unchanged(self):
+        element = make_element()
+        assert normalize_element(element) == make_element()
+
+
+class TestClones:
+    def test_clone_condition_copies_color_and_nested_conditions(self):
+        condition = {"type": "or", "color": [1, 2, 3], "conditions": [{"type": "pixel_color", "color": [4, 5, 6]}]}
+        clone = clone_condition(condition)
+        assert clone == condition
+        clone["color"][0] = 99
+        clone["conditions"][0]["color"][0] = 99
+        assert condition["color"] == [1, 2, 3]
+        assert condition["conditions"][0]["color"] == [4, 5, 6]
+
+    def test_clone_condition_keeps_missing_color(self):
+        assert clone_condition({"type": "ocr_text_match", "color": None}) == {"type": "ocr_text_match", "color": None}
+
+    def test_clone_element_is_independent(self):
+        element = make_element()
+        clone = clone_element(element)
+        assert clone == element
+        clone[0][0] = -1
+        clone[6][0]["conditions"][0]["color"][0] = -1
+        clone[9][0]["color"][0] = -1
+        assert element == make_element()
+
+    def test_clone_menu_is_independent(self):
+        menu = make_profile()["main_menu"]
+        clone = clone_menu(menu)
+        assert clone == menu
+        clone["group_order_indices"]["main"] = 5
+        clone["conditions"][0]["conditions"][0]["color"][0] = 0
+        clone["items"][0][9][0]["color"][0] = 0
+        clone["items"].append(make_element())
+        assert menu == make_profile()["main_menu"]
+
+
+class TestEncodeProfile:
+    def test_round_trips(self):
+        profile = make_profile()
+        assert decode_profile(encode_profile(profile)) == profile
+
+    def test_orjson_and_json_encodings_decode_to_the_same_data(self, monkeypatch):
+        pytest.importorskip("orjson")
+        profile = make_profile()
+        with_orjson = encode_profile(profile)
+        monkeypatch.setattr(utils, "ORJSON_AVAILABLE", False)
+        with_json = encode_profile(profile)
+        assert json.loads(with_orjson) == json.loads(with_json) == profile
+
+    def test_json_fallback_matches_json_dumps(self, monkeypatch):
+        monkeypatch.setattr(utils, "ORJSON_AVAILABLE", False)
+        profile = make_profile()
+        assert encode_profile(profile) == json.dumps(profile, indent=2).encode("ascii")
+
+    def test_non_ascii_text_is_escaped(self):
+        profile = {"menü": {"items": [[[0, 0], "Spielen ▶", "button", False, None]]}}
+        data = encode_profile(profile)
+        assert data.isascii()
+        assert json.loads(data) == profile
+
+
+class TestWriteProfileFile:
+    def test_writes_and_leaves_no_temp_file(self, tmp_path):
+        path = str(tmp_path / "profile.json")
+        record = write_profile_file(path, make_profile())
+        with open(path, "rb") as file:
+            assert decode_profile(file.read()) == make_profile()
+        assert not os.path.exists(path + ".tmp")
+        assert record[0] == path
+
+    def test_unchanged_save_is_skipped(self, tmp_path):
+        path = str(tmp_path / "profile.json")
+        record = write_profile_file(path, make_profile())
+        mtime_ns = os.stat(path).st_mtime_ns
+        assert write_profile_file(path, make_profile(), record) == record
+        assert os.stat(path).st_mtime_ns == mtime_ns
+
+    def test_changed_data_is_written(self, tmp_path):
+        path = str(tmp_path / "profile.json")
+        record = write_profile_file(path, make_profile())
+        changed = make_profile()
+        changed["main_menu"]["is_manual"] = True
+        new_record = write_profile_file(path, changed, record)
+        assert new_record[1] != record[1]
+        with open(path, "rb") as file:
+            assert decode_profile(file.read()) == changed
+
+    def test_file_edited_elsewhere_is_rewritten(self, tmp_path):
+        path = str(tmp_path / "profile.json")
+        record = write_profile_file(path, make_profile())
+        with open(path, "w") as file:
+            file.write("{}")
+        write_profile_file(path, make_profile(), record)
+        with open(path, "rb") as file:
+            assert decode_profile(file.read()) == make_profile()
+
+    def test_deleted_file_is_rewritten(self, tmp_path):
+        path = str(tmp_path / "profile.json")
+        record = write_profile_file(path, make_profile())
+        os.remove(path)
+        write_profile_file(path, make_profile(), record)
+        assert os.path.exists(path)
+
+    def test_failed_write_keeps_old_file_and_removes_temp(self, tmp_path, monkeypatch):
+        path = str(tmp_path / "profile.json")
+        write_profile_file(path, make_profile())
+        with open(path, "rb") as file:
+            original = file.read()
+
+        def failing_replace(src, dst):
+            raise OSError("disk full")
+        monkeypatch.setattr(utils.os, "replace", failing_replace)
+        changed = make_profile()
+        changed["main_menu"]["reset_index"] = False
+        with pytest.raises(OSError):
+            write_profile_file(path, changed)
+        with open(path, "rb") as file:
+            assert file.read() == original
+        assert not os.path.exists(path + ".tmp")